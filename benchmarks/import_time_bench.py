@@ -0,0 +1,70 @@
+"""
+Benchmark waktu import (cold start) modul-modul utama memakai `python -X importtime`.
+
+Setiap modul diimpor di proses Python baru, lalu output -X importtime diringkas:
+total waktu kumulatif modul tersebut dan import terberat di bawahnya.
+
+Jalankan dari root proyek:
+    python -m benchmarks.import_time_bench [--modules src.core src.ui.main_window] [--repeat 3] [--top 8]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+DEFAULT_MODULES = (
+    "src.core",
+    "src.core.encryption",
+    "src.core.parallel",
+    "src.core.search",
+    "src.ui.main_window",
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_importtime(module: str) -> list[tuple[str, int, int]]:
+    """Mengimpor module di proses baru dan mengembalikan (nama, self_us, cumulative_us) per import."""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Gagal mengimpor {module}:\n{completed.stderr.strip().splitlines()[-1]}")
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def run(modules: list[str], repeat: int, top: int) -> None:
+    for module in modules:
+        runs = [_run_importtime(module) for _ in range(repeat)]
+        # Ambil run tercepat untuk mengurangi noise dari cache disk
+        entries = min(runs, key=lambda run_entries: sum(self_us for _, self_us, _ in run_entries))
+        total_ms = sum(self_us for _, self_us, _ in entries) / 1000
+        loaded = {name for name, _, _ in entries}
+        heavy = [dep for dep in ("sympy", "pdfplumber", "sqlalchemy", "numpy", "PySide6") if dep in loaded]
+
+        print(f"{module}: {total_ms:.1f} ms, {len(entries)} modul diimpor"
+              f" (dependensi berat: {', '.join(heavy) if heavy else '-'})")
+        cumulative = {}
+        for name, _, cumulative_us in entries:
+            if name != module:
+                cumulative[name] = max(cumulative.get(name, 0), cumulative_us)
+        for name, cumulative_us in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark waktu import dengan python -X importtime.")
+    parser.add_argument("--modules", nargs="+", default=list(DEFAULT_MODULES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+    run(args.modules, args.repeat, args.top)
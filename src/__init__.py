@@ -1,2 +1,10 @@
 """UI package exposing high-level widgets."""
-from .ui.main_window import MainWindow  # noqa: F401
\ No newline at end of file
+
+
+def __getattr__(name):
+    # MainWindow is imported on first access so worker processes that only need
+    # src.core do not pay for loading PySide6
+    if name == "MainWindow":
+        from .ui.main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,34 @@
-from .kmp import kmp_search
-from .levenshtein import levenshtein_distance, levenshtein_ratio, fuzzy_search
-from .boyer_moore import boyer_moore_search
-from .pdf_parser import parse_pdf_to_text
-from .summary import get_candidate_summary
-from .aho_corasick import aho_corasick_search
-from .levenshtein import fuzzy_search
-from .encryption import encrypt, decrypt
-# from .regex_extractor import extract_email, extract_phone, extract_years
\ No newline at end of file
+import importlib
+
+# Submodul diimpor saat atributnya pertama kali diakses (PEP 562), supaya
+# `import src.core.xxx` tidak ikut memuat pdfplumber/sqlalchemy yang tidak dibutuhkan
+_LAZY_ATTRIBUTES = {
+    "kmp_search": ".kmp",
+    "levenshtein_distance": ".levenshtein",
+    "levenshtein_ratio": ".levenshtein",
+    "fuzzy_search": ".levenshtein",
+    "boyer_moore_search": ".boyer_moore",
+    "horspool_search": ".boyer_moore",
+    "sunday_search": ".boyer_moore",
+    "parse_pdf_to_text": ".pdf_parser",
+    "get_candidate_summary": ".summary",
+    "aho_corasick_search": ".aho_corasick",
+    "encrypt": ".encryption",
+    "decrypt": ".encryption",
+    "CancellationToken": ".cancellation",
+    "SearchCancelled": ".cancellation",
+    # "extract_email", "extract_phone", "extract_years": ".regex_extractor",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
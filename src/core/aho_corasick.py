@@ -1,4 +1,10 @@
+from array import array
 from collections import deque
+from functools import lru_cache
+from typing import Iterable
+
+# Alfabet hasil normalize_text: huruf kecil, angka, dan spasi
+NORMALIZED_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789 "
 
 # Fungsi untuk menambahkan pola ke dalam trie
 # Mengembalikan jumlah node yang baru
@@ -62,17 +68,139 @@ def search(text, trie, fail, output):
                 result[pattern] = result.get(pattern, 0) + 1
     return result
 
+class _ColumnTable(dict):
+    """Tabel str.translate: karakter di luar alfabet automaton dipetakan ke kolom 'lainnya'."""
+
+    def __init__(self, columns: dict, other_column: int):
+        super().__init__({ord(char): column for char, column in columns.items()})
+        self.other_column = other_column
+
+    def __missing__(self, key):
+        self[key] = self.other_column
+        return self.other_column
+
+class AhoCorasickAutomaton:
+    """
+    Automaton Aho-Corasick (trie + fail function + output) yang dibangun sekali
+    untuk satu set keyword, lalu bisa dipakai berulang untuk banyak dokumen.
+
+    Dengan compiled=True, automaton juga dikompilasi menjadi DFA penuh: tabel
+    transisi datar (array) berukuran jumlah_state x alfabet, sehingga pencocokan
+    cukup satu lookup tabel per karakter tanpa menelusuri fail link.
+    """
+
+    def __init__(self, keywords: Iterable[str], compiled: bool = False):
+        self.keywords = tuple(keywords)
+        self.trie = [{}]
+        self.fail = [0]
+        self.output = [set()]
+
+        for pattern in self.keywords:
+            add_pattern(pattern, self.trie, self.fail, self.output)
+        build_failure_function(self.trie, self.fail, self.output)
+
+        self.delta = None
+        if compiled:
+            self.compile()
+
+    def compile(self) -> None:
+        """Membangun tabel transisi DFA (delta) dan daftar output per state berupa id pattern."""
+        self.patterns = tuple(dict.fromkeys(self.keywords))
+
+        alphabet = list(NORMALIZED_ALPHABET)
+        known_chars = set(alphabet)
+        for pattern in self.patterns:
+            for char in pattern:
+                if char not in known_chars:
+                    known_chars.add(char)
+                    alphabet.append(char)
+        columns = {char: column for column, char in enumerate(alphabet)}
+        # Kolom terakhir untuk karakter yang tidak muncul di pattern mana pun (selalu kembali ke root)
+        width = len(alphabet) + 1
+        num_states = len(self.trie)
+
+        own_outputs = [[] for _ in range(num_states)]
+        for pattern_id, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                node = self.trie[node][char]
+            own_outputs[node].append(pattern_id)
+
+        # Nilai di tabel disimpan sebagai offset baris (state * width) agar lookup
+        # per karakter cukup delta[offset + kolom]
+        delta = array("i", bytes(4 * num_states * width))
+        dfa_fail = [0] * num_states
+        outputs = [()] * num_states
+        outputs[0] = tuple(own_outputs[0])
+
+        queue = deque()
+        for char, child in self.trie[0].items():
+            delta[columns[char]] = child * width
+            queue.append(child)
+
+        # BFS: state fail selalu lebih dangkal sehingga barisnya sudah lengkap
+        while queue:
+            state = queue.popleft()
+            fail_state = dfa_fail[state]
+            outputs[state] = tuple(own_outputs[state]) + outputs[fail_state]
+
+            base = state * width
+            fail_base = fail_state * width
+            delta[base:base + width] = delta[fail_base:fail_base + width]
+            for char, child in self.trie[state].items():
+                column = columns[char]
+                dfa_fail[child] = delta[fail_base + column] // width
+                delta[base + column] = child * width
+                queue.append(child)
+
+        self.width = width
+        self.delta = delta
+        # Salinan list dipakai di loop pencarian: indexing list Python lebih cepat daripada array
+        self._delta_lookup = delta.tolist()
+        self.state_outputs = outputs
+        self._column_table = _ColumnTable(columns, width - 1)
+
+    def search(self, text: str) -> dict:
+        """Mengembalikan {pattern: jumlah kemunculan} untuk pattern yang ditemukan di text."""
+        if self.delta is not None:
+            return self.search_compiled(text)
+        return search(text, self.trie, self.fail, self.output)
+
+    def search_compiled(self, text: str) -> dict:
+        """Pencocokan dengan tabel DFA: satu lookup per karakter, output dihitung per state di akhir."""
+        if self.delta is None:
+            self.compile()
+        delta = self._delta_lookup
+        width = self.width
+
+        translated = text.translate(self._column_table)
+        columns = translated.encode("latin-1") if width <= 256 else map(ord, translated)
+
+        # Hitung berapa kali tiap state dikunjungi, lalu ekspansi ke pattern sekali saja
+        visits = [0] * len(delta)
+        offset = 0
+        for column in columns:
+            offset = delta[offset + column]
+            visits[offset] += 1
+
+        counts = {}
+        for state, pattern_ids in enumerate(self.state_outputs):
+            if pattern_ids:
+                hits = visits[state * width]
+                if hits:
+                    for pattern_id in pattern_ids:
+                        counts[pattern_id] = counts.get(pattern_id, 0) + hits
+        return {self.patterns[pattern_id]: hits for pattern_id, hits in counts.items()}
+
+# Automaton di-cache per tuple keyword, sehingga satu query (dan query berikutnya
+# dengan keyword yang sama) tidak perlu membangun ulang trie untuk setiap CV
+@lru_cache(maxsize=128)
+def get_automaton(keywords: tuple) -> AhoCorasickAutomaton:
+    return AhoCorasickAutomaton(keywords, compiled=True)
+
 # Fungsi utama untuk mencocokkan keywords dengan teks
 def aho_corasick_search(keywords, normalized_cv_content) -> dict:
-    trie = [{}]
-    fail = [0] 
-    output = [set()]
-
-    for pattern in keywords:
-        add_pattern(pattern, trie, fail, output)
-    build_failure_function(trie, fail, output)
-    result = search(normalized_cv_content, trie, fail, output)    
-    return result
+    return get_automaton(tuple(keywords)).search(normalized_cv_content)
 
 # Fungsi untuk menormalisasi teks (menghapus non-alfanumerik dan mengubah menjadi huruf kecil)
 def normalize_text(text: str) -> str:
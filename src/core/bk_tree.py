@@ -0,0 +1,97 @@
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+from .levenshtein import char_bag_lower_bound, levenshtein_distance, max_distance_for_ratio
+
+# Radius "tak terbatas" untuk threshold <= 0 (semua kata dianggap mirip)
+_UNBOUNDED_RADIUS = 1 << 30
+
+
+def similarity_radius(keyword_len: int, threshold: float) -> int:
+    """
+    Jarak edit maksimum yang mungkin lolos threshold untuk keyword sepanjang keyword_len.
+
+    Untuk kata sepanjang L >= keyword_len berlaku d <= (1 - t) * L dan L <= keyword_len + d,
+    sehingga d <= (1 - t) / t * keyword_len. Kata yang lebih pendek dari keyword
+    dibatasi oleh (1 - t) * keyword_len yang lebih kecil lagi.
+    """
+    if threshold <= 0:
+        return _UNBOUNDED_RADIUS
+    # Toleransi kecil agar pembulatan floating point tidak memotong radius;
+    # kandidat tetap diverifikasi dengan threshold setelahnya
+    return int((1.0 - threshold) / threshold * keyword_len + 1e-9)
+
+
+class BKTree:
+    """
+    BK-tree (Burkhard-Keller) atas kata-kata vocabulary dengan metrik jarak Levenshtein.
+
+    Setiap node menyimpan (kata, {jarak: child}). Pencarian radius r dari node berjarak d
+    cukup menelusuri child dengan kunci di [d - r, d + r] (ketaksamaan segitiga), sehingga
+    sebagian besar vocabulary tidak perlu dibandingkan.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.root = None
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, word: str) -> bool:
+        """Menambahkan kata ke tree. Mengembalikan False jika kata sudah ada."""
+        if self.root is None:
+            self.root = (word, {})
+            self.size = 1
+            return True
+
+        node_word, children = self.root
+        while True:
+            distance = levenshtein_distance(word, node_word)
+            if distance == 0:
+                return False
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (word, {})
+                self.size += 1
+                return True
+            node_word, children = child
+
+    def search(self, word: str, radius: int) -> List[Tuple[str, int]]:
+        """Semua kata di tree dengan jarak Levenshtein <= radius dari word, sebagai (kata, jarak)."""
+        if self.root is None or radius < 0:
+            return []
+
+        word_bag = Counter(word)
+        word_len = len(word)
+        found = []
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            # Jarak di atas radius + kunci child terbesar tidak membuka child mana pun,
+            # jadi perhitungannya boleh dihentikan lebih awal
+            limit = radius + (max(children) if children else 0)
+            # Node (beserta subtree-nya) dilewati tanpa DP jika komposisi hurufnya saja
+            # sudah memastikan jarak di atas limit
+            if char_bag_lower_bound(node_word, word_bag, word_len, limit) > limit:
+                continue
+            distance = levenshtein_distance(word, node_word, limit)
+            if distance <= radius:
+                found.append((node_word, distance))
+            if children:
+                low = distance - radius
+                high = distance + radius
+                for child_distance, child in children.items():
+                    if low <= child_distance <= high:
+                        stack.append(child)
+        return found
+
+    def similar_words(self, keyword: str, threshold: float) -> List[str]:
+        """Kata-kata di tree dengan levenshtein_ratio(kata, keyword) >= threshold."""
+        keyword_len = len(keyword)
+        return [
+            word for word, distance in self.search(keyword, similarity_radius(keyword_len, threshold))
+            if distance <= max_distance_for_ratio(max(len(word), keyword_len), threshold)
+        ]
@@ -1,9 +1,162 @@
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List
+
+# Semua varian di modul ini menghitung kemunculan yang tumpang tindih,
+# konsisten dengan kmp_search (mis. "aa" di "aaaa" = 3).
+
+def compute_good_suffix_table(pattern: str) -> List[int]:
+    """
+    Tabel pergeseran good suffix (strong good suffix rule).
+
+    shift[j + 1] adalah pergeseran aman jika terjadi mismatch di posisi j
+    (pattern[j+1:] sudah cocok), dan shift[0] adalah pergeseran setelah
+    seluruh pattern cocok (periode pattern).
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+
+    # Kasus 1: suffix yang cocok muncul lagi di bagian lain pattern
+    i = m
+    j = m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+
+    # Kasus 2: hanya sebagian suffix yang cocok dengan prefix pattern
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return shift
+
+
+class BoyerMoorePattern:
+    """
+    Pola Boyer-Moore yang sudah dikompilasi: tabel last occurrence (bad character)
+    dan tabel good suffix dihitung sekali saat dibuat, lalu bisa dipakai untuk
+    mencari di banyak teks. Pergeseran diambil dari yang terbesar di antara keduanya.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        # Buat tabel last occurrence dari tiap karakter
+        self.bad_char = {c: i for i, c in enumerate(pattern)}
+        self.good_suffix = compute_good_suffix_table(pattern)
+
+    def finditer(self, text: str) -> Iterator[int]:
+        """Menghasilkan indeks awal setiap kemunculan pattern dalam text."""
+        pattern = self.pattern
+        bad_char = self.bad_char
+        good_suffix = self.good_suffix
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or m > n:
+            return
+
+        s = 0
+        while s <= n - m:
+            j = m - 1
+
+            while j >= 0 and pattern[j] == text[s + j]:
+                j -= 1
+
+            if j < 0:
+                yield s
+                s += good_suffix[0]
+            else:
+                last = bad_char.get(text[s + j], -1)
+                s += max(good_suffix[j + 1], j - last)
+
+    def count(self, text: str) -> int:
+        """Jumlah total kemunculan pattern dalam text."""
+        if len(self.pattern) == 0:
+            return 1
+        count = 0
+        for _ in self.finditer(text):
+            count += 1
+        return count
+
+
+class HorspoolPattern(BoyerMoorePattern):
+    """
+    Varian Boyer-Moore-Horspool: hanya memakai tabel bad character untuk karakter
+    teks yang sejajar dengan karakter terakhir pattern.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        m = len(pattern)
+        self.shift = {c: m - 1 - i for i, c in enumerate(pattern[:-1])}
+
+    def finditer(self, text: str) -> Iterator[int]:
+        pattern = self.pattern
+        shift = self.shift
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or m > n:
+            return
+
+        s = 0
+        while s <= n - m:
+            if text.startswith(pattern, s):
+                yield s
+            s += shift.get(text[s + m - 1], m)
+
+
+class SundayPattern(BoyerMoorePattern):
+    """
+    Varian Sunday (Quick Search): pergeseran ditentukan oleh karakter teks tepat
+    setelah jendela pencocokan, sehingga bisa bergeser hingga m + 1.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        m = len(pattern)
+        self.shift = {c: m - i for i, c in enumerate(pattern)}
+
+    def finditer(self, text: str) -> Iterator[int]:
+        pattern = self.pattern
+        shift = self.shift
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or m > n:
+            return
+
+        s = 0
+        while s <= n - m:
+            if text.startswith(pattern, s):
+                yield s
+            if s + m >= n:
+                break
+            s += shift.get(text[s + m], m + 1)
+
+
+@lru_cache(maxsize=256)
+def compile_boyer_moore(pattern: str) -> BoyerMoorePattern:
+    """BoyerMoorePattern yang di-memoize per pattern, sehingga tabel bad character/good suffix tidak dibangun ulang."""
+    return BoyerMoorePattern(pattern)
+
+@lru_cache(maxsize=256)
+def compile_horspool(pattern: str) -> HorspoolPattern:
+    return HorspoolPattern(pattern)
+
+@lru_cache(maxsize=256)
+def compile_sunday(pattern: str) -> SundayPattern:
+    return SundayPattern(pattern)
 
 def boyer_moore_search(text: str, pattern: str) -> int:
     """
     Mencari semua kemunculan 'pattern' dalam 'text' menggunakan algoritma Boyer-Moore
-    (dengan Bad Character Rule sederhana), dan mengembalikan jumlah total kemunculannya.
+    (Bad Character Rule + Good Suffix Rule), dan mengembalikan jumlah total kemunculannya.
 
     Args:
         text (str): Teks tempat pencarian dilakukan.
@@ -12,35 +165,15 @@ def boyer_moore_search(text: str, pattern: str) -> int:
     Returns:
         int: Jumlah kemunculan pattern dalam text.
     """
-    n = len(text)
-    m = len(pattern)
-
-    if m == 0:
-        return 1 if n >= 0 else 0
-    if n == 0 or m > n:
-        return 0
-
-    # Buat tabel last occurrence dari tiap karakter
-    bad_char = {c: i for i, c in enumerate(pattern)}
-
-    occurrences = []
-    s = 0
-
-    while s <= n - m:
-        j = m - 1
-
-        while j >= 0 and pattern[j] == text[s + j]:
-            j -= 1
+    return compile_boyer_moore(pattern).count(text)
 
-        if j < 0:
-            occurrences.append(s)
-            s += m  # geser penuh untuk skip overlap
-        else:
-            last = bad_char.get(text[s + j], -1)
-            shift = max(1, j - last)
-            s += shift
+def horspool_search(text: str, pattern: str) -> int:
+    """Jumlah kemunculan pattern dalam text menggunakan Boyer-Moore-Horspool."""
+    return compile_horspool(pattern).count(text)
 
-    return len(occurrences)
+def sunday_search(text: str, pattern: str) -> int:
+    """Jumlah kemunculan pattern dalam text menggunakan algoritma Sunday (Quick Search)."""
+    return compile_sunday(pattern).count(text)
 
 # Contoh penggunaan:
 # if __name__ == "__main__":
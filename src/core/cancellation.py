@@ -0,0 +1,34 @@
+import threading
+from typing import Optional
+
+
+class SearchCancelled(Exception):
+    """Dilempar oleh operasi panjang (pencarian, parsing CV) yang dibatalkan lewat CancellationToken."""
+
+
+class CancellationToken:
+    """
+    Penanda pembatalan yang aman dipakai lintas thread: thread GUI memanggil cancel(),
+    sedangkan pencarian di thread worker memeriksa raise_if_cancelled() di antara
+    langkah-langkah kecil (per CV, per batch, per jendela frasa).
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise SearchCancelled()
+
+
+def raise_if_cancelled(cancel_token: Optional[CancellationToken]) -> None:
+    """Seperti CancellationToken.raise_if_cancelled, tetapi token boleh None (tidak bisa dibatalkan)."""
+    if cancel_token is not None and cancel_token.cancelled:
+        raise SearchCancelled()
@@ -0,0 +1,356 @@
+import json
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import String, cast, func, select
+
+from src.db.database import PROJECT_ROOT, get_db_session
+from src.db.models import ApplicantProfile, ApplicationDetail, CVExtraction
+
+from .cancellation import CancellationToken, raise_if_cancelled
+from .cv_cache import PARSER_VERSION, get_cv_cache
+from .encryption import decrypt
+
+# Jumlah dokumen per query saat mengambil teks CV dari database
+TEXT_BATCH_SIZE = 200
+# Jumlah hasil ekstraksi CV lengkap (untuk halaman summary) yang disimpan di memori
+EXTRACTED_DATA_CACHE_SIZE = 32
+# Jeda minimum (detik) antar pemeriksaan checksum penuh ApplicationDetail/ApplicantProfile
+CHECKSUM_INTERVAL = 30.0
+
+
+class ApplicantCatalog:
+    """
+    Katalog pelamar di memori proses: satu entri per ApplicationDetail, disimpan per kolom
+    (array untuk id, list untuk string) dan diurutkan berdasarkan detail_id.
+
+    Nama sudah didekripsi saat dimuat; field profil lain disimpan terenkripsi dan baru
+    didekripsi saat dibutuhkan (halaman summary). Katalog dimuat ulang hanya jika
+    watermark database (jumlah baris, id maksimum, waktu ingestion terakhir, checksum
+    isi ApplicationDetail/ApplicantProfile) berubah. Checksum memindai seluruh tabel,
+    jadi hanya dihitung jika bagian murah watermark berubah atau paling sering sekali
+    per CHECKSUM_INTERVAL; UPDATE di tempat terlihat paling lambat setelah jeda itu.
+    Jika baris lama tidak berubah (checksum rentang id lama sama), hanya baris baru di
+    akhir tabel yang dimuat.
+
+    Katalog yang sudah dibagikan tidak pernah diubah: refreshed() memuat perubahan ke
+    salinan baru, sehingga pembaca yang masih memegang katalog lama (pencarian yang
+    sedang berjalan, halaman summary) tetap melihat data yang konsisten.
+    """
+
+    def __init__(self):
+        self.detail_ids = array("i")
+        self.applicant_ids = array("i")
+        self.names: List[str] = []
+        self.roles: List[Optional[str]] = []
+        self.cv_paths: List[str] = []
+        # Ciphertext (first_name, last_name, date_of_birth, address, phone_number) per entri
+        self.profiles: List[Tuple[Optional[str], ...]] = []
+        # 1 jika teks CV sudah tersedia di CVExtraction dengan PARSER_VERSION saat ini
+        self.ingested = bytearray()
+        self.watermark = None
+        # Naik setiap kali isi katalog berubah
+        self.version = 0
+        self._positions: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.detail_ids)
+
+    def position_of_detail(self, detail_id: int) -> Optional[int]:
+        return self._positions.get(detail_id)
+
+    def full_cv_path(self, position: int) -> str:
+        return os.path.join(PROJECT_ROOT, self.cv_paths[position])
+
+    # ------------------------------------------------------------------
+    # Sinkronisasi dengan database
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _checksum_queries(max_detail_id: int = None, max_applicant_id: int = None) -> tuple:
+        """
+        SUM(CRC32(...)) atas seluruh kolom ApplicationDetail dan ApplicantProfile (opsional
+        hanya sampai id tertentu). Berubah jika ada baris yang di-UPDATE, mis. nama yang
+        dienkripsi ulang atau cv_path yang diganti.
+        """
+        detail_checksum = select(_row_checksum(
+            ApplicationDetail.detail_id, ApplicationDetail.applicant_id,
+            ApplicationDetail.application_role, ApplicationDetail.cv_path
+        ))
+        profile_checksum = select(_row_checksum(
+            ApplicantProfile.applicant_id, ApplicantProfile.first_name, ApplicantProfile.last_name,
+            ApplicantProfile.date_of_birth, ApplicantProfile.address, ApplicantProfile.phone_number
+        ))
+        if max_detail_id is not None:
+            detail_checksum = detail_checksum.where(ApplicationDetail.detail_id <= max_detail_id)
+        if max_applicant_id is not None:
+            profile_checksum = profile_checksum.where(ApplicantProfile.applicant_id <= max_applicant_id)
+        return detail_checksum.scalar_subquery(), profile_checksum.scalar_subquery()
+
+    @classmethod
+    def _query_watermark(cls, db, with_checksums: bool = True) -> tuple:
+        """
+        Ringkasan isi tabel: (jumlah entri, detail_id maks, jumlah profil, applicant_id maks,
+        jumlah CVExtraction, waktu ingestion terakhir, checksum ApplicationDetail, checksum ApplicantProfile).
+        Berubah jika ada baris yang ditambah/dihapus/diubah/di-ingest ulang. Dengan
+        with_checksums=False hanya enam nilai pertama (cukup dari index/max/count) yang diambil.
+        """
+        checksums = cls._checksum_queries() if with_checksums else ()
+        return tuple(db.execute(select(
+            select(func.count()).select_from(ApplicationDetail).join(
+                ApplicantProfile, ApplicantProfile.applicant_id == ApplicationDetail.applicant_id
+            ).scalar_subquery(),
+            select(func.max(ApplicationDetail.detail_id)).scalar_subquery(),
+            select(func.count()).select_from(ApplicantProfile).scalar_subquery(),
+            select(func.max(ApplicantProfile.applicant_id)).scalar_subquery(),
+            select(func.count()).select_from(CVExtraction).scalar_subquery(),
+            select(func.max(CVExtraction.ingested_at)).scalar_subquery(),
+            *checksums,
+        )).one())
+
+    def _only_appended(self, db, watermark: tuple) -> bool:
+        """True jika dibanding watermark sebelumnya hanya ada baris baru (baris lama tidak berubah/hilang)."""
+        previous = self.watermark
+        if previous is None or watermark[0] < previous[0] or watermark[2] < previous[2]:
+            return False
+        old_checksums = tuple(db.execute(select(
+            *self._checksum_queries(max_detail_id=previous[1] or 0, max_applicant_id=previous[3] or 0)
+        )).one())
+        return old_checksums == previous[6:8]
+
+    def refreshed(self, db, verify_checksums: bool = True) -> "ApplicantCatalog":
+        """
+        Katalog yang sesuai dengan database: self jika watermark tidak berubah, atau
+        katalog baru (versi + 1) yang memuat perubahannya. self tidak pernah diubah.
+        Dengan verify_checksums=False checksum hanya dihitung jika bagian murah watermark berubah.
+        """
+        if not verify_checksums and self.watermark is not None:
+            if self._query_watermark(db, with_checksums=False) == self.watermark[:6]:
+                return self
+        watermark = self._query_watermark(db)
+        if watermark == self.watermark:
+            return self
+
+        if self._only_appended(db, watermark):
+            # Hanya ada baris baru: cukup muat ApplicationDetail setelah detail_id terakhir,
+            # lalu pastikan jumlahnya cocok (mis. detail lama yang baru mendapat profil)
+            catalog = self._copy()
+            catalog._load_entries(db, after_detail_id=self.detail_ids[-1] if self.detail_ids else 0)
+            if len(catalog) != watermark[0]:
+                catalog = None
+        else:
+            catalog = None
+        if catalog is None:
+            catalog = ApplicantCatalog()
+            catalog._load_entries(db, after_detail_id=0)
+
+        catalog._load_ingested_flags(db)
+        catalog.watermark = watermark
+        catalog.version = self.version + 1
+        return catalog
+
+    def _copy(self) -> "ApplicantCatalog":
+        catalog = ApplicantCatalog()
+        catalog.detail_ids = array("i", self.detail_ids)
+        catalog.applicant_ids = array("i", self.applicant_ids)
+        catalog.names = list(self.names)
+        catalog.roles = list(self.roles)
+        catalog.cv_paths = list(self.cv_paths)
+        catalog.profiles = list(self.profiles)
+        catalog._positions = dict(self._positions)
+        return catalog
+
+    def _load_entries(self, db, after_detail_id: int) -> None:
+        statement = select(
+            ApplicationDetail.detail_id,
+            ApplicationDetail.applicant_id,
+            ApplicationDetail.application_role,
+            ApplicationDetail.cv_path,
+            ApplicantProfile.first_name,
+            ApplicantProfile.last_name,
+            ApplicantProfile.date_of_birth,
+            ApplicantProfile.address,
+            ApplicantProfile.phone_number,
+        ).join(
+            ApplicantProfile, ApplicantProfile.applicant_id == ApplicationDetail.applicant_id
+        ).where(
+            ApplicationDetail.detail_id > after_detail_id
+        ).order_by(ApplicationDetail.detail_id).execution_options(yield_per=TEXT_BATCH_SIZE)
+
+        for rows in db.execute(statement).partitions():
+            for (detail_id, applicant_id, role, cv_path,
+                 first_name, last_name, date_of_birth, address, phone_number) in rows:
+                position = len(self.detail_ids)
+                self.detail_ids.append(detail_id)
+                self.applicant_ids.append(applicant_id)
+                self.names.append(f"{decrypt(first_name)} {decrypt(last_name)}".strip())
+                self.roles.append(role)
+                self.cv_paths.append(cv_path)
+                self.profiles.append((first_name, last_name, date_of_birth, address, phone_number))
+                self._positions[detail_id] = position
+
+    def _load_ingested_flags(self, db) -> None:
+        self.ingested = bytearray(len(self))
+        statement = select(CVExtraction.detail_id).where(
+            CVExtraction.parser_version == PARSER_VERSION
+        ).execution_options(yield_per=TEXT_BATCH_SIZE * 10)
+        for detail_id in db.execute(statement).scalars():
+            position = self._positions.get(detail_id)
+            if position is not None:
+                self.ingested[position] = 1
+
+    # ------------------------------------------------------------------
+    # Teks CV
+    # ------------------------------------------------------------------
+    def iter_extracted_data(self, db, positions: Iterable[int], with_details: bool = True,
+                            cancel_token: Optional[CancellationToken] = None) -> Iterator[Tuple[int, Optional[dict]]]:
+        """
+        Mengambil data ekstraksi CV untuk posisi-posisi katalog, per batch: CV yang sudah
+        di-ingest dari CVExtraction, sisanya dari cache ekstraksi (PDF yang belum ter-cache
+        di-parsing paralel dan dikembalikan begitu selesai, sehingga urutan posisi dalam satu
+        batch tidak dijamin). with_details=False hanya memuat teks pencarian. Data None
+        berarti file CV tidak ditemukan.
+        """
+        batch: List[int] = []
+        for position in positions:
+            batch.append(position)
+            if len(batch) >= TEXT_BATCH_SIZE:
+                yield from self._load_batch(db, batch, with_details, cancel_token)
+                batch = []
+        if batch:
+            yield from self._load_batch(db, batch, with_details, cancel_token)
+
+    def _load_batch(self, db, positions: List[int], with_details: bool,
+                    cancel_token: Optional[CancellationToken]) -> Iterator[Tuple[int, Optional[dict]]]:
+        raise_if_cancelled(cancel_token)
+        columns = [CVExtraction.detail_id, CVExtraction.parser_version, CVExtraction.full_text_search]
+        if with_details:
+            columns += [CVExtraction.full_text_normalized, CVExtraction.skills,
+                        CVExtraction.job_history, CVExtraction.education]
+
+        ingested_ids = [self.detail_ids[position] for position in positions if self.ingested[position]]
+        stored = {}
+        if ingested_ids:
+            for row in db.execute(select(*columns).where(CVExtraction.detail_id.in_(ingested_ids))):
+                if row.parser_version == PARSER_VERSION:
+                    stored[row.detail_id] = row
+
+        pending_positions: Dict[str, List[int]] = {}
+        for position in positions:
+            row = stored.get(self.detail_ids[position])
+            if row is None:
+                pending_positions.setdefault(self.full_cv_path(position), []).append(position)
+                continue
+            # Teks sudah dihitung sebelumnya oleh src.db.ingest, PDF tidak perlu disentuh
+            extracted_cv_data = {"full_text_search": row.full_text_search}
+            if with_details:
+                extracted_cv_data.update(
+                    full_text_normalized=row.full_text_normalized,
+                    skills=json.loads(row.skills),
+                    job_history=json.loads(row.job_history),
+                    education=json.loads(row.education),
+                )
+            yield position, extracted_cv_data
+
+        if pending_positions:
+            # Hasil ekstraksi diambil dari cache, PDF hanya di-parsing ulang jika berubah
+            for full_cv_path, extracted_cv_data in get_cv_cache().iter_load_many(
+                list(pending_positions), cancel_token=cancel_token
+            ):
+                for position in pending_positions.pop(full_cv_path):
+                    yield position, extracted_cv_data
+            # Sisanya file CV yang tidak ditemukan
+            for missing_positions in pending_positions.values():
+                for position in missing_positions:
+                    yield position, None
+
+
+def _row_checksum(*columns):
+    """SUM(CRC32(kolom1|kolom2|...)) per tabel; NULL diperlakukan sebagai string kosong."""
+    parts = [func.coalesce(cast(column, String), "") for column in columns]
+    joined = parts[0]
+    for part in parts[1:]:
+        joined = joined + "|" + part
+    return func.sum(func.crc32(joined))
+
+
+_catalog = ApplicantCatalog()
+_catalog_lock = threading.Lock()
+# Waktu (time.monotonic) checksum penuh terakhir dihitung oleh get_catalog
+_last_checksum_at = None
+
+def get_catalog(db) -> ApplicantCatalog:
+    """
+    Katalog bersama, diperbarui dari database hanya jika watermark-nya berubah. Katalog
+    yang dikembalikan tidak akan berubah lagi; pembaruan berikutnya menggantikannya.
+    Checksum penuh dihitung paling sering sekali per CHECKSUM_INTERVAL.
+    """
+    global _catalog, _last_checksum_at
+    with _catalog_lock:
+        now = time.monotonic()
+        verify_checksums = _last_checksum_at is None or now - _last_checksum_at >= CHECKSUM_INTERVAL
+        catalog = _catalog.refreshed(db, verify_checksums)
+        if verify_checksums or catalog is not _catalog:
+            # Katalog baru selalu berarti checksum baru saja dihitung
+            _last_checksum_at = now
+        _catalog = catalog
+        return _catalog
+
+def find_detail(db, detail_id: int) -> Tuple[ApplicantCatalog, Optional[int]]:
+    """Posisi lamaran (detail_id) di katalog bersama; database hanya dicek jika belum ada di katalog."""
+    catalog = _catalog
+    position = catalog.position_of_detail(detail_id)
+    if position is None:
+        catalog = get_catalog(db)
+        position = catalog.position_of_detail(detail_id)
+    return catalog, position
+
+
+_extracted_data_cache: "OrderedDict[Tuple[int, int], dict]" = OrderedDict()
+_extracted_data_lock = threading.Lock()
+
+def load_extracted_data(db, catalog: ApplicantCatalog, position: int) -> dict:
+    """
+    Data ekstraksi CV lengkap (teks, skills, riwayat kerja, pendidikan) untuk satu posisi
+    katalog, disimpan di cache LRU kecil sehingga membuka summary yang sama tidak
+    membaca ulang database/cache disk. Dict kosong jika file CV tidak ditemukan.
+    """
+    cache_key = (catalog.detail_ids[position], catalog.version)
+    with _extracted_data_lock:
+        extracted_cv_data = _extracted_data_cache.get(cache_key)
+        if extracted_cv_data is not None:
+            _extracted_data_cache.move_to_end(cache_key)
+            return extracted_cv_data
+
+    _, extracted_cv_data = next(catalog.iter_extracted_data(db, [position]))
+    extracted_cv_data = extracted_cv_data or {}
+    with _extracted_data_lock:
+        _extracted_data_cache[cache_key] = extracted_cv_data
+        if len(_extracted_data_cache) > EXTRACTED_DATA_CACHE_SIZE:
+            _extracted_data_cache.popitem(last=False)
+    return extracted_cv_data
+
+
+class CVDataHandle:
+    """
+    Referensi ringan ke data ekstraksi CV satu lamaran (hanya detail_id). Hasil pencarian
+    membawa handle ini alih-alih teks CV, dan datanya baru diambil saat load() dipanggil.
+    """
+
+    __slots__ = ("detail_id",)
+
+    def __init__(self, detail_id: int):
+        self.detail_id = detail_id
+
+    def __repr__(self) -> str:
+        return f"CVDataHandle(detail_id={self.detail_id})"
+
+    def load(self) -> dict:
+        with get_db_session() as db:
+            catalog, position = find_detail(db, self.detail_id)
+            if position is None:
+                return {}
+            return load_extracted_data(db, catalog, position)
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .aho_corasick import normalize_text
+from .cancellation import CancellationToken, raise_if_cancelled
+from .parallel import DEFAULT_CHUNKSIZE, extract_cvs_parallel
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache")
+CACHE_DB_PATH = os.path.join(CACHE_DIR, "cv_cache.sqlite3")
+
+# Naikkan versi ini setiap kali logika parser/ekstraksi berubah
+# supaya seluruh entri cache lama otomatis dianggap kadaluarsa.
+PARSER_VERSION = 1
+
+_JSON_FIELDS = ("phone_numbers", "skills", "job_history", "education")
+
+
+def _cache_key(pdf_path: str) -> str:
+    """Path relatif terhadap root proyek (jika di dalamnya) agar cache tetap valid saat repo dipindah."""
+    abs_path = os.path.abspath(pdf_path)
+    try:
+        rel_path = os.path.relpath(abs_path, PROJECT_ROOT)
+    except ValueError:
+        return abs_path
+    if rel_path.startswith(os.pardir):
+        return abs_path
+    return rel_path.replace(os.sep, "/")
+
+
+def file_content_hash(pdf_path: str) -> str:
+    """SHA-1 dari isi file, dipakai untuk membedakan file yang benar-benar berubah."""
+    digest = hashlib.sha1()
+    with open(pdf_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CVTextCache:
+    """
+    Cache hasil ekstraksi CV di disk (SQLite), dengan kunci path file.
+
+    Entri dianggap masih valid jika mtime dan ukuran file sama. Jika berbeda,
+    hash isi file dibandingkan dulu sebelum PDF di-parsing ulang, sehingga
+    file yang hanya di-touch/di-copy tidak perlu diproses kembali.
+    """
+
+    def __init__(self, db_path: str = CACHE_DB_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Dipakai dari thread GUI maupun QThread pencarian, jadi akses dikunci manual
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cv_text_cache (
+                    cv_path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    parser_version INTEGER NOT NULL,
+                    full_text_raw TEXT NOT NULL,
+                    full_text_normalized TEXT NOT NULL,
+                    full_text_search TEXT NOT NULL,
+                    phone_numbers TEXT NOT NULL,
+                    skills TEXT NOT NULL,
+                    job_history TEXT NOT NULL,
+                    education TEXT NOT NULL
+                )
+                """
+            )
+
+    def get(self, pdf_path: str, stat: os.stat_result = None) -> dict | None:
+        """Mengembalikan data ter-cache jika masih valid, atau None jika perlu parsing ulang."""
+        if stat is None:
+            try:
+                stat = os.stat(pdf_path)
+            except OSError:
+                return None
+
+        key = _cache_key(pdf_path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM cv_text_cache WHERE cv_path = ? AND parser_version = ?",
+                (key, PARSER_VERSION)
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = dict(row)
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            # Metadata berubah, cek apakah isinya benar-benar berubah
+            if entry["size"] != stat.st_size or entry["content_hash"] != file_content_hash(pdf_path):
+                return None
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE cv_text_cache SET mtime_ns = ? WHERE cv_path = ?",
+                    (stat.st_mtime_ns, key)
+                )
+        return self._to_extracted_data(entry)
+
+    def put(self, pdf_path: str, extracted_data: dict, stat: os.stat_result = None) -> dict:
+        """Menyimpan hasil parse_pdf_to_text_and_extract_info untuk pdf_path."""
+        if stat is None:
+            stat = os.stat(pdf_path)
+        data = dict(extracted_data)
+        data.setdefault("full_text_search", normalize_text(data.get("full_text_normalized", "")))
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO cv_text_cache (
+                    cv_path, mtime_ns, size, content_hash, parser_version,
+                    full_text_raw, full_text_normalized, full_text_search,
+                    phone_numbers, skills, job_history, education
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    _cache_key(pdf_path), stat.st_mtime_ns, stat.st_size, file_content_hash(pdf_path), PARSER_VERSION,
+                    data.get("full_text_raw", ""), data.get("full_text_normalized", ""), data["full_text_search"],
+                    *(json.dumps(data.get(field, [])) for field in _JSON_FIELDS)
+                )
+            )
+        return data
+
+    def iter_load_many(
+        self,
+        pdf_paths: Iterable[str],
+        workers: int = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        force: bool = False
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Memuat banyak CV sekaligus. Entri cache yang valid
+        dikembalikan lebih dulu, lalu PDF yang berubah di-parsing paralel dan
+        disimpan ke cache begitu selesai (urutan hasil tidak dijamin). Jika
+        cancel_token dibatalkan, PDF yang sudah selesai di-parsing tetap tersimpan.
+        force=True mengabaikan isi cache: semua PDF di-parsing ulang dan cache ditimpa.
+        """
+        stale_paths = []
+        stats = {}
+        for pdf_path in pdf_paths:
+            raise_if_cancelled(cancel_token)
+            try:
+                stat = os.stat(pdf_path)
+            except OSError:
+                continue
+            cached = None if force else self.get(pdf_path, stat)
+            if cached is not None:
+                yield pdf_path, cached
+            else:
+                stale_paths.append(pdf_path)
+                stats[pdf_path] = stat
+
+        if not stale_paths:
+            return
+        for pdf_path, extracted_data in extract_cvs_parallel(stale_paths, workers, chunksize, ordered=False,
+                                                             cancel_token=cancel_token):
+            yield pdf_path, self.put(pdf_path, extracted_data, stats[pdf_path])
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cv_text_cache")
+
+    @staticmethod
+    def _to_extracted_data(entry: dict) -> dict:
+        data = {
+            "full_text_raw": entry["full_text_raw"],
+            "full_text_normalized": entry["full_text_normalized"],
+            "full_text_search": entry["full_text_search"],
+        }
+        for field in _JSON_FIELDS:
+            data[field] = json.loads(entry[field])
+        return data
+
+
+_cv_cache = None
+_cv_cache_lock = threading.Lock()
+
+def get_cv_cache() -> CVTextCache:
+    """Instance cache bersama untuk seluruh aplikasi (dibuat saat pertama dipakai)."""
+    global _cv_cache
+    with _cv_cache_lock:
+        if _cv_cache is None:
+            _cv_cache = CVTextCache()
+    return _cv_cache
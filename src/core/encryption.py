@@ -1,8 +1,9 @@
-import sympy
+import struct
+from functools import lru_cache
 
-# Fungsi untuk mencari d menggunakan sympy.mod_inverse()
+# Fungsi untuk mencari d (invers modular e terhadap phi_n) dengan pow bawaan Python
 def mod_inverse(e, phi_n):
-    return sympy.mod_inverse(e, phi_n)
+    return pow(e, -1, phi_n)
 
 # Fungsi untuk mengubah string menjadi angka (menggunakan kode ASCII)
 def string_to_int(message):
@@ -20,45 +21,44 @@ def int_to_hex(int_list):
 def hex_to_int(hex_string):
     return [int(hex_string[i:i+4], 16) for i in range(0, len(hex_string), 4)]
 
+# Kunci RSA yang dipakai encrypt() dan decrypt()
+P = 61
+Q = 53
+N = P * Q
+PHI_N = (P - 1) * (Q - 1)
+E = 17
+D = mod_inverse(E, PHI_N)
+
+# Ciphertext heksadesimal untuk setiap nilai karakter 0..n-1 (pow(num, e, n) == pow(num % n, e, n))
+ENCRYPT_TABLE = [int_to_hex([pow(num, E, N)]) for num in range(N)]
+
 # Fungsi enkripsi
 def encrypt(message) -> str:
-    p = 61
-    q = 53
-    n = p * q
-    phi_n = (p - 1) * (q - 1)
-    e = 17
-    d = mod_inverse(e, phi_n)
+    # Mengubah pesan menjadi angka lalu mengenkripsi setiap angka lewat tabel
+    table = ENCRYPT_TABLE
+    return ''.join([table[num % N] for num in string_to_int(message)])
 
-    # Kunci publik dan privat
-    public_key = (e, n)
+# Karena n sangat kecil, hasil dekripsi semua ciphertext 0..n-1 dihitung sekali di awal
+DECRYPT_TABLE = [chr(pow(num, D, N)) for num in range(N)]
 
-    # Mengubah pesan menjadi angka dan mengenkripsi setiap angka
-    message_int = string_to_int(message)
-    ciphertext_int = [pow(num, e, n) for num in message_int]
-    
-    # Mengonversi ciphertext menjadi string heksadesimal
-    ciphertext_hex = int_to_hex(ciphertext_int)
-    ciphertext_hex = str(ciphertext_hex)  # Pastikan ciphertext_hex adalah string
-    return ciphertext_hex
+# Fungsi untuk mengubah seluruh string heksadesimal (blok 4 digit) menjadi angka sekaligus
+def hex_to_int_bulk(hex_string):
+    if len(hex_string) % 4 == 0:
+        try:
+            raw = bytes.fromhex(hex_string)
+        except ValueError:
+            pass
+        else:
+            return struct.unpack(f">{len(raw) // 2}H", raw)
+    # Format tidak standar: gunakan cara per blok
+    return hex_to_int(hex_string)
 
-# Fungsi dekripsi
+# Fungsi dekripsi (hasil per ciphertext di-memoize karena nama yang sama didekripsi di setiap pencarian)
+@lru_cache(maxsize=65536)
 def decrypt(ciphertext_hex) -> str:
-    p = 61
-    q = 53
-    n = p * q
-    phi_n = (p - 1) * (q - 1)
-    e = 17
-    d = mod_inverse(e, phi_n)
-
-    # Kunci publik dan privat
-    private_key = (d, n)
-
     # Mengubah ciphertext heksadesimal menjadi angka
-    ciphertext_int = hex_to_int(ciphertext_hex)
+    ciphertext_int = hex_to_int_bulk(ciphertext_hex)
 
-    # Mendekripsi setiap angka
-    decrypted_int = [pow(num, d, n) for num in ciphertext_int]
-    
-    # Mengubah hasil dekripsi kembali menjadi string
-    decrypted_message = int_to_string(decrypted_int)
-    return decrypted_message
\ No newline at end of file
+    # Mendekripsi setiap angka lewat tabel (pow(num, d, n) == pow(num % n, d, n))
+    table = DECRYPT_TABLE
+    return ''.join([table[num % N] for num in ciphertext_int])
\ No newline at end of file
@@ -0,0 +1,315 @@
+import os
+import pickle
+import threading
+import zlib
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .bk_tree import BKTree
+from .levenshtein import phrase_pieces
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+INDEX_PATH = os.path.join(PROJECT_ROOT, ".cache", "inverted_index.pkl")
+
+# Naikkan jika format file index berubah
+INDEX_VERSION = 2
+
+
+def _text_signature(text: str) -> Tuple[int, int]:
+    return len(text), zlib.crc32(text.encode("utf-8"))
+
+
+class InvertedIndex:
+    """
+    Inverted index token -> {doc_id: posisi token} atas teks CV yang sudah dinormalisasi
+    (huruf kecil, alfanumerik, dipisah satu spasi).
+
+    Karena teks ter-normalisasi berupa token yang digabung dengan satu spasi, setiap
+    kemunculan keyword satu kata pasti berada di dalam satu token. Jumlah kemunculan
+    keyword di sebuah dokumen = jumlah (kemunculan keyword di token t) x (frekuensi t),
+    sehingga hasilnya identik dengan memindai seluruh teks dengan KMP/BM.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, array]] = {}
+        self.doc_signatures: Dict[int, Tuple[int, int]] = {}
+        self._doc_terms: Dict[int, List[str]] = {}
+        self._expansion_cache: Dict[tuple, List[Tuple[str, int]]] = {}
+        # BK-tree atas vocabulary untuk fuzzy matching; token yang sudah dihapus dari
+        # postings tetap ada di tree dan disaring saat query
+        self.fuzzy_tree = BKTree()
+        # Naik setiap kali dokumen ditambah/diganti/dihapus; dipakai sebagai bagian kunci
+        # cache hasil pencarian (tidak disimpan ke disk, cache-nya juga hanya di memori)
+        self.generation = 0
+
+    # ------------------------------------------------------------------
+    # Pembangunan index
+    # ------------------------------------------------------------------
+    def add_document(self, doc_id: int, text: str) -> None:
+        """Menambahkan (atau mengganti) dokumen doc_id dengan teks ter-normalisasi."""
+        if doc_id in self.doc_signatures:
+            self.remove_document(doc_id)
+
+        tokens = text.split()
+        doc_postings: Dict[str, array] = {}
+        for position, token in enumerate(tokens):
+            positions = doc_postings.get(token)
+            if positions is None:
+                positions = doc_postings[token] = array("I")
+            positions.append(position)
+
+        for token, positions in doc_postings.items():
+            docs = self.postings.get(token)
+            if docs is None:
+                docs = self.postings[token] = {}
+                self.fuzzy_tree.add(token)
+            docs[doc_id] = positions
+
+        self.doc_signatures[doc_id] = _text_signature(text)
+        self._doc_terms[doc_id] = list(doc_postings)
+        self._expansion_cache.clear()
+        self.generation += 1
+
+    def remove_document(self, doc_id: int) -> None:
+        for token in self._doc_terms.pop(doc_id, []):
+            docs = self.postings.get(token)
+            if docs is not None:
+                docs.pop(doc_id, None)
+                if not docs:
+                    del self.postings[token]
+        self.doc_signatures.pop(doc_id, None)
+        self._expansion_cache.clear()
+        self.generation += 1
+
+    def iter_sync(self, documents: Iterable[Tuple[int, str]], remove_missing: bool = True,
+                  on_indexed: Optional[Callable[[int, str], None]] = None) -> Iterator[int]:
+        """
+        Menyamakan isi index dengan daftar (doc_id, text): dokumen baru/berubah
+        di-index ulang dan dokumen yang sudah tidak ada (atau dengan text None)
+        dihapus. Dengan remove_missing=False hanya dokumen yang diberikan yang diperbarui.
+
+        Menghasilkan jumlah dokumen yang sudah diperiksa setelah setiap dokumen (untuk
+        progres) dan memanggil on_indexed(doc_id, text) untuk setiap dokumen yang
+        di-index (ulang). Nilai kembalian generator: True jika index berubah (perlu disimpan ulang).
+        """
+        changed = False
+        seen = set()
+        for checked, (doc_id, text) in enumerate(documents, start=1):
+            if text is None:
+                # Teks tidak tersedia lagi (mis. file CV hilang)
+                if doc_id in self.doc_signatures:
+                    self.remove_document(doc_id)
+                    changed = True
+            else:
+                seen.add(doc_id)
+                if self.doc_signatures.get(doc_id) != _text_signature(text):
+                    self.add_document(doc_id, text)
+                    changed = True
+                    if on_indexed is not None:
+                        on_indexed(doc_id, text)
+            yield checked
+
+        if remove_missing:
+            for doc_id in [doc_id for doc_id in self.doc_signatures if doc_id not in seen]:
+                self.remove_document(doc_id)
+                changed = True
+        return changed
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def expand_substring(self, keyword: str, count_fn: Callable[[str, str], int]) -> List[Tuple[str, int]]:
+        """
+        Daftar (token, jumlah kemunculan keyword di token) untuk semua token di
+        vocabulary yang mengandung keyword. count_fn(text, pattern) adalah fungsi
+        pencocokan yang dipilih (mis. kmp_search) sehingga aturan overlap tetap sama.
+        """
+        cache_key = (keyword, count_fn)
+        expansion = self._expansion_cache.get(cache_key)
+        if expansion is None:
+            expansion = []
+            for token in self.postings:
+                # Filter cepat dengan operator `in` sebelum menjalankan algoritma
+                if keyword in token:
+                    occurrences = count_fn(token, keyword)
+                    if occurrences:
+                        expansion.append((token, occurrences))
+            self._expansion_cache[cache_key] = expansion
+        return expansion
+
+    def count_keyword(self, keyword: str, count_fn: Callable[[str, str], int]) -> Dict[int, int]:
+        """
+        Menghitung kemunculan keyword satu kata di setiap dokumen tanpa memindai teks:
+        gabungan (union) posting list semua token yang mengandung keyword.
+
+        Returns:
+            Dict[int, int]: {doc_id: jumlah kemunculan} (hanya dokumen dengan kemunculan > 0).
+        """
+        counts: Dict[int, int] = {}
+        for token, occurrences in self.expand_substring(keyword, count_fn):
+            for doc_id, positions in self.postings[token].items():
+                counts[doc_id] = counts.get(doc_id, 0) + occurrences * len(positions)
+        return counts
+
+    def similar_terms(self, keyword: str, threshold: float) -> List[str]:
+        """Token di vocabulary dengan levenshtein_ratio(token, keyword) >= threshold (lewat BK-tree)."""
+        cache_key = ("fuzzy", keyword, threshold)
+        terms = self._expansion_cache.get(cache_key)
+        if terms is None:
+            terms = [
+                token for token in self.fuzzy_tree.similar_words(keyword, threshold)
+                if token in self.postings
+            ]
+            self._expansion_cache[cache_key] = terms
+        return terms
+
+    def fuzzy_count(self, keyword: str, threshold: float) -> Dict[int, int]:
+        """
+        Jumlah kata yang mirip keyword per dokumen, setara dengan fuzzy_search pada
+        teks setiap dokumen: keyword diekspansi sekali ke token-token mirip di
+        vocabulary, lalu frekuensinya dijumlahkan dari posting list.
+        """
+        counts: Dict[int, int] = {}
+        for token in self.similar_terms(keyword, threshold):
+            for doc_id, positions in self.postings[token].items():
+                counts[doc_id] = counts.get(doc_id, 0) + len(positions)
+        return counts
+
+    def _matching_terms(self, kind: str, word: str) -> List[str]:
+        """Token di vocabulary yang diakhiri ('suffix'), diawali ('prefix') atau sama dengan ('exact') word."""
+        cache_key = (kind, word)
+        terms = self._expansion_cache.get(cache_key)
+        if terms is None:
+            if kind == "suffix":
+                terms = [token for token in self.postings if token.endswith(word)]
+            elif kind == "prefix":
+                terms = [token for token in self.postings if token.startswith(word)]
+            else:
+                terms = [word] if word in self.postings else []
+            self._expansion_cache[cache_key] = terms
+        return terms
+
+    def phrase_positions(self, phrase: str) -> Dict[int, List[int]]:
+        """
+        Posisi token awal setiap kemunculan frasa (keyword lebih dari satu kata) per dokumen,
+        dihitung dengan menggabungkan posting list posisi tanpa memindai teks.
+
+        Pada teks ter-normalisasi, "w1 w2 ... wk" muncul sebagai substring tepat ketika
+        ada token berurutan t1..tk dengan t1 diakhiri w1, t2..t(k-1) sama dengan w2..w(k-1),
+        dan tk diawali wk.
+        """
+        words = phrase.split()
+        last = len(words) - 1
+        starts: Dict[int, Set[int]] = None
+        for offset, word in enumerate(words):
+            kind = "suffix" if offset == 0 else ("prefix" if offset == last else "exact")
+            doc_starts: Dict[int, Set[int]] = {}
+            for token in self._matching_terms(kind, word):
+                for doc_id, positions in self.postings[token].items():
+                    if starts is not None and doc_id not in starts:
+                        continue
+                    doc_starts.setdefault(doc_id, set()).update(position - offset for position in positions)
+
+            if starts is None:
+                starts = doc_starts
+            else:
+                merged = {}
+                for doc_id, positions in doc_starts.items():
+                    common = starts[doc_id] & positions
+                    if common:
+                        merged[doc_id] = common
+                starts = merged
+            if not starts:
+                return {}
+        return {doc_id: sorted(positions) for doc_id, positions in (starts or {}).items()}
+
+    def candidate_docs(self, keyword: str, count_fn: Callable[[str, str], int]) -> Set[int]:
+        """
+        Dokumen yang memuat keyword. Untuk frasa dipakai positional index, sehingga
+        algoritma pemindaian cukup dijalankan pada dokumen kandidat sebagai verifikasi.
+        """
+        words = keyword.split()
+        if not words:
+            return set(self.doc_signatures)
+        if len(words) == 1:
+            docs = set()
+            for token, _ in self.expand_substring(words[0], count_fn):
+                docs.update(self.postings[token])
+            return docs
+        return set(self.phrase_positions(keyword))
+
+    def approximate_phrase_docs(self, phrase: str, max_distance: int, count_fn: Callable[[str, str], int]) -> Set[int]:
+        """
+        Dokumen yang mungkin memuat phrase dengan <= max_distance edit (superset), tanpa
+        memindai teks: salah satu potongan phrase_pieces pasti muncul persis di teks, dan
+        kemunculan setiap potongan dicari seperti keyword biasa lewat candidate_docs.
+        """
+        if max_distance < 0:
+            return set()
+        pieces = phrase_pieces(phrase, max_distance)
+        if not pieces:
+            return set(self.doc_signatures)
+        docs = set()
+        for _, piece in pieces:
+            # Potongan bisa diawali/diakhiri spasi; tanpa spasi tersebut syaratnya hanya lebih longgar
+            docs |= self.candidate_docs(piece, count_fn)
+        return docs
+
+    # ------------------------------------------------------------------
+    # Persistensi
+    # ------------------------------------------------------------------
+    def save(self, path: str = INDEX_PATH) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({
+                "version": INDEX_VERSION,
+                "postings": self.postings,
+                "doc_signatures": self.doc_signatures,
+                "doc_terms": self._doc_terms,
+                "fuzzy_tree": self.fuzzy_tree,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = INDEX_PATH) -> "InvertedIndex":
+        """Memuat index dari disk; mengembalikan index kosong jika file tidak ada/tidak valid."""
+        index = cls()
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return index
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return index
+        index.postings = data["postings"]
+        index.doc_signatures = data["doc_signatures"]
+        index._doc_terms = data["doc_terms"]
+        index.fuzzy_tree = data["fuzzy_tree"]
+        return index
+
+
+_inverted_index = None
+_inverted_index_lock = threading.Lock()
+
+def get_inverted_index() -> InvertedIndex:
+    """Index bersama untuk seluruh aplikasi, dimuat dari disk saat pertama kali dipakai."""
+    global _inverted_index
+    with _inverted_index_lock:
+        if _inverted_index is None:
+            _inverted_index = InvertedIndex.load()
+    return _inverted_index
+
+def iter_sync_inverted_index(documents: Iterable[Tuple[int, str]], remove_missing: bool = True,
+                             on_indexed: Optional[Callable[[int, str], None]] = None) -> Iterator[int]:
+    """
+    Sinkronkan index bersama dengan dokumen terbaru (lihat InvertedIndex.iter_sync) dan
+    simpan ke disk jika berubah. Jumlah dokumen yang sudah diperiksa dihasilkan agar
+    pemanggil bisa melaporkan progres; nilai kembalian generator adalah index bersama. Lock index dipegang sampai generator selesai atau ditutup, jadi jangan
+    memanggil get_inverted_index() di sela-selanya.
+    """
+    index = get_inverted_index()
+    with _inverted_index_lock:
+        if (yield from index.iter_sync(documents, remove_missing, on_indexed)):
+            index.save()
+    return index
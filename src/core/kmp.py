@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List
 
 def compute_lps_array(pattern: str) -> List[int]:
     """
@@ -22,6 +23,55 @@ def compute_lps_array(pattern: str) -> List[int]:
                 i += 1
     return lps
 
+class KMPPattern:
+    """
+    Pola KMP yang sudah dikompilasi: tabel LPS dihitung sekali saat dibuat,
+    lalu bisa dipakai untuk mencari di banyak teks.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.lps = compute_lps_array(pattern)
+
+    def finditer(self, text: str) -> Iterator[int]:
+        """Menghasilkan indeks awal setiap kemunculan pattern (termasuk yang tumpang tindih)."""
+        pattern = self.pattern
+        lps = self.lps
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or m > n:
+            return
+
+        i = 0
+        j = 0
+        while i < n:
+            if pattern[j] == text[i]:
+                i += 1
+                j += 1
+
+            if j == m:
+                yield i - m
+                j = lps[j - 1]
+            elif i < n and pattern[j] != text[i]:
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+
+    def count(self, text: str) -> int:
+        """Jumlah total kemunculan pattern dalam text."""
+        if len(self.pattern) == 0:
+            return 1
+        count = 0
+        for _ in self.finditer(text):
+            count += 1
+        return count
+
+@lru_cache(maxsize=256)
+def compile_kmp(pattern: str) -> KMPPattern:
+    """KMPPattern yang di-memoize per pattern, sehingga tabel LPS tidak dihitung ulang."""
+    return KMPPattern(pattern)
+
 def kmp_search(text: str, pattern: str) -> int:
     """
     KMP Search yang mengembalikan jumlah total kemunculan pattern dalam text.
@@ -33,31 +83,4 @@ def kmp_search(text: str, pattern: str) -> int:
     Returns:
         int: Jumlah kemunculan pola dalam teks.
     """
-    n = len(text)
-    m = len(pattern)
-
-    if m == 0:
-        return 1 if n >= 0 else 0
-    if n == 0 or m > n:
-        return 0
-
-    lps = compute_lps_array(pattern)
-    count = 0
-    i = 0
-    j = 0
-
-    while i < n:
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-
-        if j == m:
-            count += 1
-            j = lps[j - 1]
-        elif i < n and pattern[j] != text[i]:
-            if j != 0:
-                j = lps[j - 1]
-            else:
-                i += 1
-
-    return count
\ No newline at end of file
+    return compile_kmp(pattern).count(text)
@@ -1,9 +1,63 @@
-from typing import List
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
-def levenshtein_distance(s1: str, s2: str) -> int:
-    """Menghitung jarak Levenshtein antara dua string s1 dan s2."""
+from .cancellation import CancellationToken, raise_if_cancelled
+
+# Panjang pola maksimum untuk algoritma bit-parallel (satu "word" 64 bit)
+MYERS_MAX_PATTERN = 64
+
+@lru_cache(maxsize=1024)
+def _pattern_bitmasks(pattern: str) -> Dict[str, int]:
+    """Peq[c]: bitmask posisi karakter c di pattern (bit i = pattern[i] == c)."""
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+def _myers_distance(pattern: str, text: str, max_distance: int = None) -> int:
+    """
+    Jarak Levenshtein bit-parallel (Myers/Hyyrö) untuk pattern dengan panjang 1..64.
+    Satu kolom matriks DP dihitung sekaligus dengan operasi bit, sehingga
+    kompleksitasnya O(n) untuk n = len(text).
+
+    Jika max_distance diberikan, pencarian berhenti lebih awal begitu jarak
+    dipastikan melebihi batas tersebut (mengembalikan max_distance + 1).
+    """
+    m = len(pattern)
+    n = len(text)
+    peq = _pattern_bitmasks(pattern)
+    mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+
+    pv = mask
+    mv = 0
+    score = m
+    for j, c in enumerate(text):
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last_bit:
+            score += 1
+        elif mh & last_bit:
+            score -= 1
+        # Baris 0 matriks DP selalu naik 1 per kolom (jarak global)
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+        # Setiap karakter sisa paling banyak menurunkan skor sebesar 1
+        if max_distance is not None and score - (n - j - 1) > max_distance:
+            return max_distance + 1
+    return score
+
+def _dp_distance(s1: str, s2: str, max_distance: int = None) -> int:
+    """Versi DP baris-per-baris, dipakai untuk string yang lebih panjang dari 64 karakter."""
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
 
     previous_row = list(range(len(s2) + 1))
     for i, c1 in enumerate(s1, start=1):
@@ -13,10 +67,46 @@ def levenshtein_distance(s1: str, s2: str) -> int:
             deletions = current_row[j-1] + 1
             substitutions = previous_row[j-1] + (c1 != c2)
             current_row.append(min(insertions, deletions, substitutions))
+        # Nilai minimum satu baris tidak pernah turun di baris berikutnya
+        if max_distance is not None and min(current_row) > max_distance:
+            return max_distance + 1
         previous_row = current_row
 
     return previous_row[-1]
 
+def levenshtein_distance(s1: str, s2: str, max_distance: int = None) -> int:
+    """
+    Menghitung jarak Levenshtein antara dua string s1 dan s2.
+
+    Jika max_distance diberikan dan jaraknya lebih besar dari batas tersebut,
+    yang dikembalikan adalah max_distance + 1 (nilai pastinya tidak dihitung).
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
+    if not s2:
+        return len(s1)
+    if len(s2) <= MYERS_MAX_PATTERN:
+        # String yang lebih pendek menjadi pattern (bitmask), yang lebih panjang dipindai
+        return _myers_distance(s2, s1, max_distance)
+    return _dp_distance(s1, s2, max_distance)
+
+def max_distance_for_ratio(max_len: int, threshold: float) -> int:
+    """
+    Jarak terbesar d yang masih memenuhi 1 - d / max_len >= threshold.
+    Dihitung dengan ekspresi yang sama seperti levenshtein_ratio supaya
+    pembulatan floating point tidak mengubah hasil.
+    """
+    if max_len == 0:
+        return 0 if threshold <= 1.0 else -1
+    d = int((1.0 - threshold) * max_len)
+    while d >= 0 and 1.0 - (d / max_len) < threshold:
+        d -= 1
+    while d < max_len and 1.0 - ((d + 1) / max_len) >= threshold:
+        d += 1
+    return d
+
 def levenshtein_ratio(s1: str, s2: str) -> float:
     """Menghitung rasio kemiripan dua string berdasarkan jarak Levenshtein."""
     distance = levenshtein_distance(s1, s2)
@@ -25,12 +115,156 @@ def levenshtein_ratio(s1: str, s2: str) -> float:
         return 1.0  # kedua string kosong
     return 1.0 - (distance / max_len)
 
+def _myers_end_positions(pattern: str, text: str, max_distance: int, start: int, end: int) -> Iterator[int]:
+    """
+    Mode pencarian Myers: baris 0 matriks DP bernilai 0 (kecocokan boleh dimulai di
+    posisi mana pun), sehingga skor di kolom j adalah jarak edit terkecil antara
+    pattern dan substring text yang berakhir di j. Menghasilkan semua j di
+    [start, end) dengan skor <= max_distance.
+    """
+    m = len(pattern)
+    peq = _pattern_bitmasks(pattern)
+    mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+
+    pv = mask
+    mv = 0
+    score = m
+    for j in range(start, end):
+        eq = peq.get(text[j], 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last_bit:
+            score += 1
+        elif mh & last_bit:
+            score -= 1
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        if score <= max_distance:
+            yield j
+
+def _sellers_end_positions(pattern: str, text: str, max_distance: int, start: int, end: int) -> Iterator[int]:
+    """Versi DP (Sellers) dari _myers_end_positions untuk pattern lebih dari 64 karakter."""
+    m = len(pattern)
+    column = list(range(m + 1))
+    for j in range(start, end):
+        c = text[j]
+        diagonal = column[0]
+        column[0] = 0
+        for i in range(1, m + 1):
+            value = min(column[i] + 1, column[i-1] + 1, diagonal + (pattern[i-1] != c))
+            diagonal = column[i]
+            column[i] = value
+        if column[m] <= max_distance:
+            yield j
+
+def phrase_pieces(phrase: str, max_distance: int) -> List[Tuple[int, str]]:
+    """
+    Memecah phrase menjadi max_distance + 1 potongan (offset, potongan). Setiap substring
+    dengan <= max_distance edit dari phrase pasti memuat salah satu potongan secara persis
+    (prinsip pigeonhole). List kosong jika phrase terlalu pendek untuk dipecah.
+    """
+    m = len(phrase)
+    pieces = max_distance + 1
+    if pieces > m:
+        return []
+    bounds = [i * m // pieces for i in range(pieces + 1)]
+    return [(offset, phrase[offset:piece_end]) for offset, piece_end in zip(bounds, bounds[1:])]
+
+def _phrase_windows(text: str, phrase: str, max_distance: int) -> List[Tuple[int, int]]:
+    """
+    Bagian text yang mungkin memuat kemunculan phrase dengan <= max_distance edit:
+    cukup memeriksa sekitar kemunculan persis potongan-potongan dari phrase_pieces.
+    Jendela yang bersinggungan digabung.
+    """
+    n = len(text)
+    m = len(phrase)
+    pieces = phrase_pieces(phrase, max_distance)
+    if not pieces:
+        return [(0, n)]
+
+    windows = []
+    for offset, piece in pieces:
+        position = text.find(piece)
+        while position != -1:
+            match_start = position - offset
+            windows.append((max(0, match_start - max_distance), min(n, match_start + m + max_distance)))
+            position = text.find(piece, position + 1)
+
+    windows.sort()
+    merged = []
+    for start, end in windows:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def approximate_phrase_count(text: str, phrase: str, threshold: float,
+                             cancel_token: Optional[CancellationToken] = None) -> int:
+    """
+    Menghitung kemunculan phrase (boleh lebih dari satu kata) di text dengan toleransi
+    salah ketik: substring text yang jarak editnya ke phrase <= batas dari threshold
+    (1 - d / len(phrase) >= threshold). Posisi akhir berurutan yang memenuhi batas
+    dianggap satu kemunculan. cancel_token diperiksa di setiap jendela kandidat.
+    """
+    m = len(phrase)
+    if m == 0:
+        return 0
+    max_distance = max_distance_for_ratio(m, threshold)
+    if max_distance < 0:
+        return 0
+
+    find_end_positions = _myers_end_positions if m <= MYERS_MAX_PATTERN else _sellers_end_positions
+    count = 0
+    previous = -2
+    for start, end in _phrase_windows(text, phrase, max_distance):
+        raise_if_cancelled(cancel_token)
+        for position in find_end_positions(phrase, text, max_distance, start, end):
+            if position != previous + 1:
+                count += 1
+            previous = position
+    return count
+
+def char_bag_lower_bound(word: str, keyword_bag: Dict[str, int], keyword_len: int, max_distance: int) -> int:
+    """
+    Batas bawah jarak Levenshtein dari selisih multiset karakter: setiap operasi edit
+    hanya bisa menutup satu karakter berlebih dan/atau satu karakter yang kurang.
+    Berhenti begitu batas melewati max_distance.
+    """
+    remaining = dict(keyword_bag)
+    surplus = 0
+    for c in word:
+        left = remaining.get(c, 0)
+        if left:
+            remaining[c] = left - 1
+        else:
+            surplus += 1
+            if surplus > max_distance:
+                return surplus
+    deficit = keyword_len - (len(word) - surplus)
+    return max(surplus, deficit)
+
 def fuzzy_search(text: str, keyword: str, threshold: float) -> int:
-    """Mencari dan menghitung jumlah kemunculan kata dalam text yang mirip dengan keyword berdasarkan Levenshtein Distance."""
-    words = text.split()
+    """
+    Mencari dan menghitung jumlah kemunculan kata dalam text yang mirip dengan keyword berdasarkan Levenshtein Distance.
+    Setiap kata unik hanya dibandingkan sekali; kata yang panjangnya atau komposisi hurufnya
+    sudah pasti melewati batas jarak ditolak sebelum menjalankan Levenshtein.
+    """
+    keyword_len = len(keyword)
+    keyword_bag = Counter(keyword)
     count = 0
-    for word in words:
-        ratio = levenshtein_ratio(word, keyword)
-        if ratio >= threshold:
-            count += 1
+    for word, occurrences in Counter(text.split()).items():
+        max_distance = max_distance_for_ratio(max(len(word), keyword_len), threshold)
+        if max_distance < 0 or abs(len(word) - keyword_len) > max_distance:
+            continue
+        if char_bag_lower_bound(word, keyword_bag, keyword_len, max_distance) > max_distance:
+            continue
+        if levenshtein_distance(word, keyword, max_distance) <= max_distance:
+            count += occurrences
     return count
@@ -0,0 +1,143 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .cancellation import CancellationToken, SearchCancelled, raise_if_cancelled
+from .pdf_parser import parse_pdf_to_text_and_extract_info
+
+# Jumlah worker default bisa diatur lewat .env, misal CV_PARSE_WORKERS=4
+DEFAULT_CHUNKSIZE = 4
+# Selang (detik) pemeriksaan token pembatalan saat menunggu hasil dari worker
+CANCEL_POLL_INTERVAL = 0.05
+# Worker dibuat dengan "spawn", bukan fork (default di Linux): fork dari proses GUI Qt
+# yang punya banyak thread dapat mewarisi lock yang sedang dipegang dan membuat worker deadlock
+POOL_START_METHOD = "spawn"
+
+
+def get_worker_count(workers: int = None) -> int:
+    """Menentukan jumlah proses worker: argumen > env CV_PARSE_WORKERS > jumlah core CPU."""
+    if workers is None:
+        env_workers = os.getenv("CV_PARSE_WORKERS")
+        workers = int(env_workers) if env_workers else (os.cpu_count() or 1)
+    return max(1, workers)
+
+
+# Fungsi worker harus berada di level modul agar bisa di-pickle ke proses lain
+def _extract_one(pdf_path: str) -> Tuple[str, dict]:
+    return pdf_path, parse_pdf_to_text_and_extract_info(pdf_path)
+
+def _extract_chunk(pdf_paths: List[str]) -> List[Tuple[str, dict]]:
+    return [_extract_one(pdf_path) for pdf_path in pdf_paths]
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Pool proses bersama yang dipakai ulang oleh semua pemanggil (mis. setiap batch CV
+    di katalog), sehingga proses worker hanya di-spawn sekali. Pool baru dibuat jika
+    jumlah worker yang diminta berbeda atau pool sebelumnya rusak.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None and _executor_workers != workers:
+            # Tugas milik pemanggil lain yang masih memakai pool lama tetap diselesaikan
+            _executor.shutdown(wait=False)
+            _executor = None
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(POOL_START_METHOD)
+            )
+            _executor_workers = workers
+        return _executor
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Melepas pool yang rusak (mis. worker mati) agar pemanggilan berikutnya membuat pool baru."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def shutdown_pool() -> None:
+    """Menghentikan pool bersama; tugas yang belum berjalan dibuang. Dipanggil otomatis saat proses keluar."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+atexit.register(shutdown_pool)
+
+
+def extract_cvs_parallel(
+    pdf_paths: Iterable[str],
+    workers: int = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    cancel_token: Optional[CancellationToken] = None
+) -> Iterator[Tuple[str, dict]]:
+    """
+    Menjalankan parse_pdf_to_text_and_extract_info untuk banyak CV sekaligus
+    menggunakan ProcessPoolExecutor bersama (lihat _get_executor).
+
+    Args:
+        pdf_paths: Daftar path PDF yang akan diproses.
+        workers (int): Jumlah proses worker (default: get_worker_count()).
+        chunksize (int): Jumlah PDF yang dikirim ke worker dalam satu tugas.
+        ordered (bool): Jika True hasil mengikuti urutan pdf_paths, jika False
+                        hasil dikembalikan segera setelah tiap chunk selesai.
+        cancel_token: Jika dibatalkan, chunk yang belum berjalan dibuang tanpa
+                      menunggu chunk yang sedang berjalan, dan SearchCancelled dilempar.
+
+    Yields:
+        Tuple (pdf_path, extracted_data) untuk setiap PDF.
+    """
+    pdf_paths = list(pdf_paths)
+    workers = get_worker_count(workers)
+    chunksize = max(1, chunksize)
+
+    # Tidak perlu memakai pool untuk satu worker / satu file
+    if min(workers, len(pdf_paths)) <= 1:
+        for pdf_path in pdf_paths:
+            raise_if_cancelled(cancel_token)
+            yield _extract_one(pdf_path)
+        return
+
+    executor = _get_executor(workers)
+    futures = []
+    try:
+        futures = [
+            executor.submit(_extract_chunk, pdf_paths[i:i + chunksize])
+            for i in range(0, len(pdf_paths), chunksize)
+        ]
+        if ordered:
+            for future in futures:
+                while not future.done():
+                    raise_if_cancelled(cancel_token)
+                    wait([future], timeout=CANCEL_POLL_INTERVAL)
+                yield from future.result()
+            return
+
+        pending = set(futures)
+        while pending:
+            raise_if_cancelled(cancel_token)
+            done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    except (SearchCancelled, GeneratorExit):
+        # Pool tetap hidup untuk pemanggil berikutnya: chunk yang belum berjalan dibuang,
+        # chunk yang sedang berjalan dibiarkan selesai di belakang tanpa ditunggu
+        for future in futures:
+            future.cancel()
+        raise
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
@@ -1,4 +1,3 @@
-import pdfplumber
 import os
 import re
 
@@ -6,6 +5,9 @@ def extract_text_from_pdf_raw(pdf_path: str) -> str | None:
     if not os.path.exists(pdf_path):
         return None
     
+    # pdfplumber cukup berat, jadi baru diimpor saat benar-benar ada PDF yang dibaca
+    import pdfplumber
+
     text = ""
     try:
         with pdfplumber.open(pdf_path) as pdf:
@@ -1,71 +1,312 @@
 import os
-from functools import lru_cache
+import threading
+from collections import OrderedDict
 
 from src.utils.timer import start_timer, stop_timer
-from typing import List, Tuple, Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from src.db.database import get_db_session
-from src.db.models import ApplicantProfile, ApplicationDetail
 
-from .kmp import kmp_search
-from .boyer_moore import boyer_moore_search
-from .aho_corasick import aho_corasick_search
-from .levenshtein import fuzzy_search
-from .encryption import decrypt
+from .kmp import kmp_search, compile_kmp
+from .boyer_moore import (
+    boyer_moore_search, compile_boyer_moore,
+    horspool_search, compile_horspool,
+    sunday_search, compile_sunday
+)
+from .aho_corasick import aho_corasick_search, get_automaton
+from .levenshtein import approximate_phrase_count, max_distance_for_ratio
+from .cancellation import CancellationToken, raise_if_cancelled
 
-from src.core.pdf_parser import parse_pdf_to_text_and_extract_info
+from .catalog import TEXT_BATCH_SIZE, ApplicantCatalog, CVDataHandle, get_catalog
+from .inverted_index import iter_sync_inverted_index
+from .top_n import TopNCollector
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Jumlah CV yang diproses di antara dua event progres pada iter_search
+PROGRESS_INTERVAL = 50
+# Jumlah hasil pencarian terakhir yang disimpan (pengganti lru_cache pada perform_search)
+SEARCH_CACHE_SIZE = 64
+
+_search_cache: "OrderedDict[tuple, Tuple[List[Dict], int, Dict]]" = OrderedDict()
+# Inverted index bersama dan _search_cache diubah di tempat, jadi hanya satu pencarian yang
+# berjalan pada satu waktu: pencarian baru menunggu pencarian yang dibatalkan berhenti di
+# titik pemeriksaan berikutnya sebelum menyinkronkan index
+_search_lock = threading.Lock()
+
 def normalize_text(text: str) -> str:
     normalized = ''.join([char.lower() if char.isalnum() else ' ' for char in text])
     return ' '.join(normalized.split())
 
-@lru_cache(maxsize=64)
-def perform_search(keywords_tuple: Tuple[str, ...], selected_algorithm: str, top_n: int) -> Tuple[List[Dict], int, Dict]:
-    results = []
+# Fungsi penghitung kemunculan (text, pattern) -> int untuk tiap pilihan algoritma,
+# dipakai baik untuk memindai teks CV maupun token di inverted index
+def _aho_corasick_count(text: str, pattern: str) -> int:
+    return aho_corasick_search([pattern], text).get(pattern, 0)
+
+def _str_count(text: str, pattern: str) -> int:
+    return text.count(pattern)
+
+def _get_exact_counter(selected_algorithm: str):
+    if selected_algorithm == "KMP":
+        return kmp_search
+    if selected_algorithm == "Boyer-Moore":
+        return boyer_moore_search
+    if selected_algorithm == "Horspool":
+        return horspool_search
+    if selected_algorithm == "Sunday":
+        return sunday_search
+    if selected_algorithm == "Aho-Corasick":
+        return _aho_corasick_count
+    return _str_count
+
+def _get_pattern_compiler(selected_algorithm: str):
+    """Fungsi kompilasi pola (KMPPattern/BoyerMoorePattern dan variannya) untuk algoritma satu-pola."""
+    if selected_algorithm == "KMP":
+        return compile_kmp
+    if selected_algorithm == "Boyer-Moore":
+        return compile_boyer_moore
+    if selected_algorithm == "Horspool":
+        return compile_horspool
+    if selected_algorithm == "Sunday":
+        return compile_sunday
+    return None
+
+# Versi katalog yang terakhir disinkronkan penuh ke inverted index
+_indexed_catalog_version = None
+
+def _index_documents(catalog: ApplicantCatalog, items) -> Iterator[Tuple[int, str]]:
+    """(detail_id, teks pencarian) untuk inverted index; teks None berarti CV tidak ditemukan."""
+    for position, extracted_cv_data in items:
+        if extracted_cv_data is None:
+            print(f"File CV tidak ditemukan di '{catalog.full_cv_path(position)}'.")
+            yield catalog.detail_ids[position], None
+        else:
+            yield catalog.detail_ids[position], extracted_cv_data["full_text_search"]
+
+def _positions_to_sync(catalog: ApplicantCatalog) -> Tuple[List[int], bool]:
+    """
+    Posisi katalog yang perlu disinkronkan ke inverted index, dan apakah sinkronisasinya penuh.
+    Sinkronisasi penuh (teks semua CV di-stream dari database) hanya jika katalog berubah.
+    Jika tidak, cukup CV yang belum di-ingest yang dicek ulang lewat cache, karena
+    sumbernya adalah file PDF yang bisa berubah tanpa mengubah database.
+    """
+    if catalog.version != _indexed_catalog_version:
+        return list(range(len(catalog))), True
+    return [position for position in range(len(catalog)) if not catalog.ingested[position]], False
+
+def _sync_index_with_catalog(db, catalog: ApplicantCatalog, positions: List[int], full_sync: bool,
+                             cancel_token: Optional[CancellationToken] = None,
+                             on_indexed=None) -> Iterator[int]:
+    """
+    Menyinkronkan inverted index dengan posisi dari _positions_to_sync. Menghasilkan jumlah CV
+    yang sudah diperiksa setelah setiap CV (untuk progres), dan nilai kembaliannya adalah
+    inverted index yang sudah sinkron. on_indexed(detail_id, teks) dipanggil untuk CV yang
+    baru/berubah dan karena itu di-index ulang.
+    """
+    global _indexed_catalog_version
+    inverted_index = yield from iter_sync_inverted_index(_index_documents(
+        catalog, catalog.iter_extracted_data(db, positions, with_details=False, cancel_token=cancel_token)
+    ), remove_missing=full_sync, on_indexed=on_indexed)
+    if full_sync:
+        _indexed_catalog_version = catalog.version
+    return inverted_index
+
+def _iter_search_texts(db, catalog: ApplicantCatalog, needs_text,
+                      cancel_token: Optional[CancellationToken] = None) -> Iterator[Tuple[int, str]]:
+    """
+    Semua posisi katalog berurutan beserta teks pencariannya. Teks hanya diambil
+    (per batch) untuk posisi dengan needs_text(position) True, sisanya None.
+    """
+    for batch_start in range(0, len(catalog), TEXT_BATCH_SIZE):
+        positions = range(batch_start, min(batch_start + TEXT_BATCH_SIZE, len(catalog)))
+        texts = {
+            position: extracted_cv_data["full_text_search"]
+            for position, extracted_cv_data in catalog.iter_extracted_data(
+                db, [position for position in positions if needs_text(position)], with_details=False,
+                cancel_token=cancel_token
+            )
+            if extracted_cv_data is not None
+        }
+        for position in positions:
+            yield position, texts.get(position)
+
+def _exact_text_matches(normalized_cv_content: str, keywords_tuple: Tuple[str, ...], normalized_keywords: List[str],
+                        selected_algorithm: str, count_fn) -> Dict[str, int]:
+    """
+    Jumlah kemunculan exact setiap keyword pada satu teks CV (tanpa fuzzy), dengan kunci
+    yang sama seperti matched_keywords_detail hasil akhir. Dipakai untuk top-N sementara
+    selama inverted index masih dibangun.
+    """
+    if selected_algorithm == "Aho-Corasick":
+        patterns = tuple(keyword for keyword in normalized_keywords if keyword)
+        return get_automaton(patterns).search(normalized_cv_content) if patterns else {}
+    matches = {}
+    for original_keyword, normalized_keyword in zip(keywords_tuple, normalized_keywords):
+        if normalized_keyword:
+            occurrences = count_fn(normalized_cv_content, normalized_keyword)
+            if occurrences > 0:
+                matches[original_keyword] = occurrences
+    return matches
+
+def _is_single_token(normalized_keyword: str) -> bool:
+    """Keyword satu kata bisa dijawab langsung dari inverted index."""
+    return bool(normalized_keyword) and " " not in normalized_keyword
+
+def _materialize_results(catalog: ApplicantCatalog, ranked_matches) -> List[Dict]:
+    """
+    Membentuk dict hasil untuk (posisi, total, detail) yang sudah terurut. Hasil hanya
+    berisi data yang ditampilkan kartu hasil; teks CV dan hasil ekstraksi lainnya
+    diambil saat dibutuhkan lewat handle "cv_data" (CVDataHandle.load()).
+    """
+    return [
+        {
+            "name": catalog.names[position],
+            "matched_keywords_detail": matched_keywords_detail,
+            "total_matches": total_matches,
+            "applicant_id": catalog.applicant_ids[position],
+            "cv_path": catalog.full_cv_path(position),
+            "cv_data": CVDataHandle(catalog.detail_ids[position]),
+        }
+        for position, total_matches, matched_keywords_detail in ranked_matches
+    ]
+
+def perform_search(keywords_tuple: Tuple[str, ...], selected_algorithm: str, top_n: int,
+                   cancel_token: Optional[CancellationToken] = None) -> Tuple[List[Dict], int, Dict]:
+    """
+    Menjalankan pencarian sampai selesai dan mengembalikan (hasil top-N, jumlah CV, waktu eksekusi).
+    Melempar SearchCancelled jika cancel_token dibatalkan di tengah jalan.
+    """
+    for event in iter_search(keywords_tuple, selected_algorithm, top_n, cancel_token=cancel_token):
+        if event["done"]:
+            return event["results"], event["total_cv_scan"], event["timings"]
+
+def iter_search(keywords_tuple: Tuple[str, ...], selected_algorithm: str, top_n: int,
+                progress_interval: int = PROGRESS_INTERVAL,
+                cancel_token: Optional[CancellationToken] = None) -> Iterator[Dict]:
+    """
+    Versi streaming dari perform_search. Setiap progress_interval CV yang diproses,
+    generator menghasilkan event dict:
+        stage          : "indexing" selama inverted index disinkronkan (teks CV dibaca/PDF di-parsing),
+                         lalu "matching" selama pencocokan keyword
+        processed      : jumlah CV yang sudah diproses pada stage ini
+        total_cv_scan  : jumlah CV pada stage ini ("matching": jumlah seluruh CV)
+        results        : top-N sementara, atau None jika tidak berubah sejak event sebelumnya. Pada stage
+                         "indexing" hanya berisi kecocokan exact dari CV yang baru di-index; pada stage
+                         "matching" urutannya sama dengan hasil akhir
+        timings        : waktu eksekusi sejauh ini
+        done           : True pada event terakhir (results berisi hasil akhir)
+    Top-N dijaga dengan TopNCollector (heap berukuran top_n) selama pemindaian. cancel_token diperiksa
+    per CV, per batch teks, dan di dalam parsing PDF/pencocokan frasa; jika dibatalkan,
+    SearchCancelled dilempar dan hasil tidak disimpan ke cache. Cache diperiksa setelah index
+    disinkronkan dan dikunci per versi katalog dan generasi index, sehingga perubahan data
+    pelamar maupun file PDF yang belum di-ingest tidak pernah menyajikan peringkat lama.
+    """
     timings = {"exact_ms": 0.0, "fuzzy_ms": 0.0}
     
     normalized_keywords_input = [normalize_text(keyword) for keyword in keywords_tuple]
 
-    with get_db_session() as db:
-        applicants_query = db.query(ApplicantProfile, ApplicationDetail).join(
-            ApplicationDetail, ApplicantProfile.applicant_id == ApplicationDetail.applicant_id
-        )
-        all_applicants = applicants_query.all()
-        total_cv_scan = len(all_applicants)
-        applicant_matches = []
-
-        for applicant_profile, application in all_applicants:
-            cv_path = application.cv_path
-            applicant_id = applicant_profile.applicant_id
-            
-            # Panggil decrypt() tetap ada sesuai permintaan Anda
-            full_name = f"{decrypt(applicant_profile.first_name)} {decrypt(applicant_profile.last_name)}".strip()
-
-            cv_content = ""
-            extracted_skills = []
-            extracted_job_history = []
-            extracted_education = []
-
-            full_cv_path = os.path.join(PROJECT_ROOT, cv_path)
-            if os.path.exists(full_cv_path):
-                try:
-                    # Parsing dan ekstraksi info dilakukan setiap saat
-                    extracted_cv_data = parse_pdf_to_text_and_extract_info(full_cv_path)
-                    cv_content = extracted_cv_data["full_text_normalized"]
-                    extracted_skills = extracted_cv_data.get("skills", [])
-                    extracted_job_history = extracted_cv_data.get("job_history", [])
-                    extracted_education = extracted_cv_data.get("education", [])
-                except Exception as e:
-                    print(f"Error parsing PDF '{full_cv_path}': {e}")
-                    continue # Lanjut ke CV berikutnya jika parsing gagal
-            else:
-                print(f"File CV tidak ditemukan di '{full_cv_path}'.")
-                continue # Lanjut ke CV berikutnya
+    with _search_lock, get_db_session() as db:
+        # Data pelamar diambil dari katalog di memori; database hanya dibaca ulang jika berubah
+        catalog = get_catalog(db)
+        total_cv_scan = len(catalog)
+
+        # Selama pemindaian hanya (total, posisi) dan detail keyword top-N yang disimpan;
+        # data berat (teks, skills, riwayat kerja) baru diambil saat summary dibuka
+        top_matches = TopNCollector(top_n)
+        top_changed = False
+
+        count_fn = _get_exact_counter(selected_algorithm)
+
+        # Selama index disinkronkan (mis. PDF baru yang di-parsing), CV yang di-index ulang langsung
+        # dicocokkan secara exact pada teksnya supaya top-N sementara sudah bisa ditampilkan
+        indexing_matches = TopNCollector(top_n)
+        indexing_changed = False
+
+        def offer_indexed_text(doc_id: int, normalized_cv_content: str) -> None:
+            nonlocal indexing_changed
+            matches = _exact_text_matches(normalized_cv_content, keywords_tuple, normalized_keywords_input,
+                                          selected_algorithm, count_fn)
+            total_matches = sum(matches.values())
+            if total_matches > 0 and indexing_matches.offer(total_matches, catalog.position_of_detail(doc_id), matches):
+                indexing_changed = True
+
+        positions_to_sync, full_sync = _positions_to_sync(catalog)
+        syncing = _sync_index_with_catalog(db, catalog, positions_to_sync, full_sync, cancel_token, offer_indexed_text)
+        while True:
+            try:
+                checked = next(syncing)
+            except StopIteration as stop:
+                inverted_index = stop.value
+                break
+            if checked % progress_interval == 0 and checked < len(positions_to_sync):
+                yield {
+                    "stage": "indexing",
+                    "processed": checked,
+                    "total_cv_scan": len(positions_to_sync),
+                    "results": _materialize_results(catalog, indexing_matches.ranked()) if indexing_changed else None,
+                    "timings": dict(timings),
+                    "done": False,
+                }
+                indexing_changed = False
 
-            # Lakukan pencarian pada cv_content yang baru saja di-parsing
-            normalized_cv_content = normalize_text(cv_content)
+        # PDF yang belum di-ingest bisa berubah tanpa mengubah versi katalog; perubahan itu
+        # baru terlihat setelah sinkronisasi, lewat generasi index
+        cache_key = (keywords_tuple, selected_algorithm, top_n, catalog.version, inverted_index.generation)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            _search_cache.move_to_end(cache_key)
+            results, total_cv_scan, timings = cached
+            yield {"stage": "matching", "processed": total_cv_scan, "total_cv_scan": total_cv_scan,
+                   "results": results, "timings": dict(timings), "done": True}
+            return
+
+        # Keyword satu kata dijawab dari inverted index (posting list per detail_id).
+        # Keyword frasa dicari kandidat dokumennya lewat positional index, lalu
+        # algoritma pilihan hanya dijalankan pada kandidat tersebut sebagai verifikasi
+        exact_match_timer_start = start_timer()
+        indexed_counts = {
+            keyword: inverted_index.count_keyword(keyword, count_fn)
+            for keyword in normalized_keywords_input if _is_single_token(keyword)
+        }
+        phrase_keywords = [keyword for keyword in normalized_keywords_input if keyword not in indexed_counts]
+        phrase_candidates = {
+            keyword: inverted_index.candidate_docs(keyword, count_fn)
+            for keyword in phrase_keywords if keyword
+        }
+        # Pola frasa dikompilasi sekali per query (tabel LPS / bad character / automaton)
+        compile_pattern = _get_pattern_compiler(selected_algorithm)
+        phrase_matchers = {
+            keyword: compile_pattern(keyword) for keyword in phrase_keywords
+        } if compile_pattern else {}
+        # Ekspansi fuzzy per keyword (BK-tree atas vocabulary), dihitung saat pertama dibutuhkan
+        fuzzy_counts = {}
+        phrase_automaton = get_automaton(tuple(phrase_keywords)) if selected_algorithm == "Aho-Corasick" else None
+        # Pencocokan aproksimasi frasa (fuzzy) butuh teks CV, tetapi hanya untuk dokumen yang
+        # memuat salah satu potongan pigeonhole frasa tersebut (dicari lewat inverted index)
+        fuzzy_phrase_candidates = {
+            keyword: inverted_index.approximate_phrase_docs(
+                keyword, max_distance_for_ratio(len(keyword), 0.8), count_fn
+            )
+            for keyword in phrase_keywords if " " in keyword
+        } if selected_algorithm != "Aho-Corasick" else {}
+        timings["exact_ms"] += stop_timer(exact_match_timer_start, f"Inverted Index Lookup using {selected_algorithm}")
+
+        def needs_text(position: int) -> bool:
+            """Teks CV hanya diambil untuk dokumen yang harus dipindai (verifikasi frasa / fuzzy frasa)."""
+            doc_id = catalog.detail_ids[position]
+            if doc_id not in inverted_index.doc_signatures:
+                return False
+            return any(
+                keyword not in phrase_candidates or doc_id in phrase_candidates[keyword]
+                for keyword in phrase_keywords
+            ) or any(doc_id in candidates for candidates in fuzzy_phrase_candidates.values())
+
+        for position, normalized_cv_content in _iter_search_texts(db, catalog, needs_text, cancel_token):
+            raise_if_cancelled(cancel_token)
+            applicant_id = catalog.applicant_ids[position]
+            doc_id = catalog.detail_ids[position]
+            if doc_id not in inverted_index.doc_signatures:
+                continue # File CV tidak ditemukan, lanjut ke CV berikutnya
 
             current_applicant_total_matches = 0
             current_applicant_matched_keywords_detail = {}
@@ -73,18 +314,24 @@ def perform_search(keywords_tuple: Tuple[str, ...], selected_algorithm: str, top
             exact_match_timer_start = start_timer()
             
             if selected_algorithm == "Aho-Corasick":
-                results_from_algo = aho_corasick_search(normalized_keywords_input, normalized_cv_content)
+                results_from_algo = {}
+                for keyword, counts in indexed_counts.items():
+                    if counts.get(doc_id, 0) > 0:
+                        results_from_algo[keyword] = counts[doc_id]
+                if normalized_cv_content is not None:
+                    results_from_algo.update(phrase_automaton.search(normalized_cv_content))
                 current_applicant_matched_keywords_detail.update(results_from_algo)
                 current_applicant_total_matches = sum(results_from_algo.values())
             else:
                 for original_keyword, normalized_keyword in zip(keywords_tuple, normalized_keywords_input):
-                    current_keyword_occurrences = 0
-                    if selected_algorithm == "KMP":
-                        current_keyword_occurrences = kmp_search(normalized_cv_content, normalized_keyword)
-                    elif selected_algorithm == "Boyer-Moore":
-                        current_keyword_occurrences = boyer_moore_search(normalized_cv_content, normalized_keyword)
+                    if normalized_keyword in indexed_counts:
+                        current_keyword_occurrences = indexed_counts[normalized_keyword].get(doc_id, 0)
+                    elif normalized_keyword in phrase_candidates and doc_id not in phrase_candidates[normalized_keyword]:
+                        current_keyword_occurrences = 0
+                    elif normalized_keyword in phrase_matchers:
+                        current_keyword_occurrences = phrase_matchers[normalized_keyword].count(normalized_cv_content)
                     else:
-                        current_keyword_occurrences = normalized_cv_content.count(normalized_keyword)
+                        current_keyword_occurrences = count_fn(normalized_cv_content, normalized_keyword)
                     
                     if current_keyword_occurrences > 0:
                         current_applicant_total_matches += current_keyword_occurrences
@@ -98,7 +345,18 @@ def perform_search(keywords_tuple: Tuple[str, ...], selected_algorithm: str, top
             if selected_algorithm != "Aho-Corasick":
                 for original_keyword, normalized_keyword in zip(keywords_tuple, normalized_keywords_input):
                     if original_keyword not in current_applicant_matched_keywords_detail:
-                        fuzzy_occurrences = fuzzy_search(normalized_cv_content, normalized_keyword, threshold=0.8)
+                        if " " in normalized_keyword:
+                            # Frasa dicocokkan secara aproksimasi langsung pada teks CV (hanya dokumen kandidat)
+                            if doc_id not in fuzzy_phrase_candidates[normalized_keyword] or normalized_cv_content is None:
+                                fuzzy_occurrences = 0
+                            else:
+                                fuzzy_occurrences = approximate_phrase_count(
+                                    normalized_cv_content, normalized_keyword, threshold=0.8, cancel_token=cancel_token
+                                )
+                        else:
+                            if normalized_keyword not in fuzzy_counts:
+                                fuzzy_counts[normalized_keyword] = inverted_index.fuzzy_count(normalized_keyword, threshold=0.8)
+                            fuzzy_occurrences = fuzzy_counts[normalized_keyword].get(doc_id, 0)
                         if fuzzy_occurrences > 0:
                             current_applicant_total_matches += fuzzy_occurrences
                             typo_keyword = f"{original_keyword} (typo)"
@@ -109,19 +367,26 @@ def perform_search(keywords_tuple: Tuple[str, ...], selected_algorithm: str, top
                  timings["fuzzy_ms"] += stop_timer(fuzzy_match_timer_start, f"Fuzzy Match for Applicant {applicant_id}")
 
             if current_applicant_total_matches > 0:
-                applicant_matches.append({
-                    "name": full_name,
-                    "matched_keywords_detail": current_applicant_matched_keywords_detail,
-                    "total_matches": current_applicant_total_matches,
-                    "applicant_id": applicant_id,
-                    "cv_path": full_cv_path,
-                    "cv_content": cv_content, 
-                    "skills": extracted_skills,
-                    "job_history": extracted_job_history,
-                    "education": extracted_education
-                })
-
-    applicant_matches.sort(key=lambda x: x["total_matches"], reverse=True)
-    results = applicant_matches[:top_n]
-    
-    return results, total_cv_scan, timings
+                # Pada total yang sama, CV yang dipindai lebih dulu menang (sama seperti sort stabil)
+                if top_matches.offer(current_applicant_total_matches, position, current_applicant_matched_keywords_detail):
+                    top_changed = True
+
+            processed = position + 1
+            if processed % progress_interval == 0 and processed < total_cv_scan:
+                yield {
+                    "stage": "matching",
+                    "processed": processed,
+                    "total_cv_scan": total_cv_scan,
+                    "results": _materialize_results(catalog, top_matches.ranked()) if top_changed else None,
+                    "timings": dict(timings),
+                    "done": False,
+                }
+                top_changed = False
+
+        results = _materialize_results(catalog, top_matches.ranked())
+        _search_cache[cache_key] = (results, total_cv_scan, timings)
+        if len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+
+    yield {"stage": "matching", "processed": total_cv_scan, "total_cv_scan": total_cv_scan,
+           "results": results, "timings": dict(timings), "done": True}
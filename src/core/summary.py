@@ -1,25 +1,23 @@
 from src.db.database import get_db_session
-from src.db.models import ApplicantProfile, ApplicationDetail
 from .encryption import decrypt 
-from .pdf_parser import parse_pdf_to_text_and_extract_info
+from .catalog import find_detail, load_extracted_data
 
-def get_candidate_summary(applicant_id: int, full_cv_path: str, cv_content: str = None) -> dict:
+def get_candidate_summary(detail_id: int) -> dict:
     """
-    Mengambil summary kandidat berdasarkan applicant_id yang diberikan
+    Mengambil summary kandidat untuk lamaran (detail_id) yang dipilih
     dengan menggabungkan data dari applicantprofile dan applicationdetail,
-    serta informasi yang diekstrak (semuanya di variabel, tidak menyentuh DB).
+    serta informasi yang diekstrak dari CV lamaran tersebut (diambil saat dibutuhkan, lewat cache).
+    Satu pelamar bisa memiliki beberapa lamaran, jadi kuncinya detail_id, bukan applicant_id.
     """
     with get_db_session() as db:
-        result = db.query(ApplicantProfile, ApplicationDetail) \
-                   .join(ApplicationDetail, ApplicantProfile.applicant_id == ApplicationDetail.applicant_id) \
-                   .filter(ApplicantProfile.applicant_id == applicant_id) \
-                   .first()
+        # Profil pelamar diambil dari katalog di memori, bukan query baru ke database
+        catalog, position = find_detail(db, detail_id)
 
-        if result:
-            applicant_profile, application_detail = result
+        if position is not None:
+            first_name, last_name, date_of_birth, address, phone_number = catalog.profiles[position]
 
-            # Langsung parsing file CV
-            extracted_cv_data = parse_pdf_to_text_and_extract_info(full_cv_path)
+            # Hasil ingestion di database, atau hasil parsing CV dari cache (parsing ulang hanya jika file berubah)
+            extracted_cv_data = load_extracted_data(db, catalog, position)
 
             # Simpan hasil ekstraksi ke variabel
             extracted_skills = extracted_cv_data.get("skills", [])
@@ -27,17 +25,17 @@ def get_candidate_summary(applicant_id: int, full_cv_path: str, cv_content: str
             extracted_education = extracted_cv_data.get("education", [])
 
             summary_data = {
-                "applicant_id": applicant_profile.applicant_id,
-                "first_name": decrypt(applicant_profile.first_name),
-                "last_name": decrypt(applicant_profile.last_name),
-                "date_of_birth": decrypt(applicant_profile.date_of_birth),
-                "address": decrypt(applicant_profile.address),
-                "phone_number": decrypt(applicant_profile.phone_number),
-                "role": application_detail.application_role,
+                "applicant_id": catalog.applicant_ids[position],
+                "first_name": decrypt(first_name),
+                "last_name": decrypt(last_name),
+                "date_of_birth": decrypt(date_of_birth),
+                "address": decrypt(address),
+                "phone_number": decrypt(phone_number),
+                "role": catalog.roles[position],
                 "skills": extracted_skills,
                 "job_history": extracted_job_history,
                 "education": extracted_education,
-                "cv_content": cv_content
+                "cv_content": extracted_cv_data.get("full_text_normalized", "")
             }
             return summary_data
         else:
@@ -0,0 +1,57 @@
+import heapq
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class TopNCollector:
+    """
+    Pengumpul top-N berbasis heapq dengan memori O(limit).
+
+    Heap hanya berisi entri ringan (skor, -urutan, kunci); data tambahan (payload) disimpan
+    terpisah dan dibuang begitu kuncinya tergeser dari top-N. Pada skor yang sama, kandidat
+    yang ditawarkan lebih dulu menang, sehingga hasilnya identik dengan sort stabil
+    menurun lalu slicing [:limit].
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(0, limit)
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._payloads: Dict[Hashable, Any] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def accepts(self, score: int) -> bool:
+        """True jika kandidat baru dengan skor ini akan masuk top-N (belum penuh atau mengalahkan peringkat terakhir)."""
+        if len(self._heap) < self.limit:
+            return True
+        return self.limit > 0 and score > self._heap[0][0]
+
+    def offer(self, score: int, key: Hashable, payload: Any = None) -> bool:
+        """
+        Menawarkan kandidat; setiap kunci cukup ditawarkan sekali.
+
+        Returns:
+            bool: True jika isi top-N berubah.
+        """
+        sequence = self._sequence
+        self._sequence += 1
+        if not self.accepts(score):
+            return False
+
+        entry = (score, -sequence, key)
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        else:
+            _, _, evicted_key = heapq.heapreplace(self._heap, entry)
+            self._payloads.pop(evicted_key, None)
+        if payload is not None:
+            self._payloads[key] = payload
+        return True
+
+    def ranked(self) -> List[Tuple[Hashable, int, Any]]:
+        """Isi top-N sebagai (kunci, skor, payload), urut skor menurun lalu urutan ditawarkan."""
+        return [
+            (key, score, self._payloads.get(key))
+            for score, _, key in sorted(self._heap, reverse=True)
+        ]
@@ -1,2 +1,2 @@
 from .database import get_db_session, PROJECT_ROOT
-from .models import ApplicantProfile, ApplicationDetail, Base
\ No newline at end of file
+from .models import ApplicantProfile, ApplicationDetail, CVExtraction, Base
\ No newline at end of file
@@ -1,8 +1,12 @@
 import os
+import re
+import threading
+import zlib
 from contextlib import contextmanager
-from sqlalchemy import create_engine, text, exc
+from sqlalchemy import create_engine, event, text, exc
 from sqlalchemy.orm import sessionmaker, Session
 from dotenv import load_dotenv
+from .models import Base, CVExtraction
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 load_dotenv()
@@ -12,26 +16,85 @@ DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
 
+# "mysql" (default) atau "sqlite" untuk menjalankan aplikasi/benchmark tanpa server MySQL
+DB_BACKEND = os.getenv("DB_BACKEND", "mysql").strip().lower()
+# Path relatif dihitung dari root proyek
+DB_SQLITE_PATH = os.path.join(PROJECT_ROOT, os.getenv("DB_SQLITE_PATH") or os.path.join(".cache", f"{DB_NAME or 'ats_db'}.sqlite3"))
+
+# Pengaturan connection pool (dipakai bersama oleh GUI dan thread pencarian)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").strip().lower() in ("1", "true", "yes", "on")
+
 SERVER_ENGINE_URL = f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}"
-DATABASE_URL = f"{SERVER_ENGINE_URL}/{DB_NAME}"
+if DB_BACKEND == "sqlite":
+    DATABASE_URL = f"sqlite:///{DB_SQLITE_PATH}"
+else:
+    DATABASE_URL = f"{SERVER_ENGINE_URL}/{DB_NAME}"
 
 engine = None
 SessionLocal = None
+_engine_lock = threading.Lock()
+
+def _sqlite_crc32(value):
+    return None if value is None else zlib.crc32(str(value).encode("utf-8"))
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL agar pembacaan (pencarian) tidak terblokir oleh penulisan (ingestion/enkripsi)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+    # CRC32() bawaan MySQL, dipakai katalog pelamar untuk mendeteksi perubahan isi tabel
+    dbapi_connection.create_function("crc32", 1, _sqlite_crc32, deterministic=True)
+
+def create_database_engine(url: str = None):
+    """Membuat engine dengan pengaturan pool dari .env."""
+    url = url or DATABASE_URL
+    options = dict(
+        echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+    if url.startswith("sqlite"):
+        # Koneksi SQLite dipakai bergantian oleh beberapa thread lewat pool
+        options["connect_args"] = {"check_same_thread": False, "timeout": DB_POOL_TIMEOUT}
+        os.makedirs(os.path.dirname(os.path.abspath(DB_SQLITE_PATH)), exist_ok=True)
+    new_engine = create_engine(url, **options)
+    if url.startswith("sqlite"):
+        event.listen(new_engine, "connect", _set_sqlite_pragmas)
+    return new_engine
 
 def initialize_engine_and_session():
     """Menginisialisasi engine dan session SQLAlchemy ke database yang sudah ada."""
     global engine, SessionLocal
-    try:
-        if engine is None:
-            engine = create_engine(DATABASE_URL, echo=False)
-        if SessionLocal is None:
-            SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        with engine.connect() as connection:
-            print(f"Koneksi ke database '{DB_NAME}' berhasil.")
-    except exc.OperationalError as e:
-        print(f"Gagal terhubung ke database '{DB_NAME}'. Pastikan database sudah ada dan kredensial benar.")
-        print(f"Detail Error: {e}")
-        raise
+    with _engine_lock:
+        if engine is not None and SessionLocal is not None:
+            return
+        try:
+            if engine is None:
+                engine = create_database_engine()
+            if SessionLocal is None:
+                SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            # Tabel hasil ingestion CV dibuat otomatis jika belum ada (tidak ada di file seeding).
+            # Koneksi yang dipakai di sini langsung kembali ke pool, jadi tidak perlu koneksi uji terpisah
+            Base.metadata.create_all(bind=engine, tables=[CVExtraction.__table__])
+            print(f"Koneksi ke database '{DB_SQLITE_PATH if DB_BACKEND == 'sqlite' else DB_NAME}' berhasil.")
+        except exc.OperationalError as e:
+            print(f"Gagal terhubung ke database '{DB_NAME}'. Pastikan database sudah ada dan kredensial benar.")
+            print(f"Detail Error: {e}")
+            raise
+
+def get_engine():
+    """Engine SQLAlchemy bersama (diinisialisasi saat pertama kali dipakai)."""
+    if engine is None:
+        initialize_engine_and_session()
+    return engine
 
 @contextmanager
 def get_db_session():
@@ -47,10 +110,49 @@ def get_db_session():
     finally:
         db.close()
 
+def _sqlite_statement(command: str):
+    """Menyesuaikan satu perintah dari file seeding MySQL untuk SQLite (None jika dilewati)."""
+    if command.upper().startswith("SET "):
+        return None
+    return re.sub(r"\)\s*ENGINE\s*=.*$", ")", command, flags=re.IGNORECASE | re.DOTALL)
+
+def setup_sqlite_database_from_sql(sql_file_path: str, drop_db_if_exists: bool = True):
+    """Seeding database SQLite lokal dari file seeding MySQL yang sama."""
+    global engine, SessionLocal
+    print(f"Memulai proses setup database SQLite di '{DB_SQLITE_PATH}'...")
+    if drop_db_if_exists:
+        if engine is not None:
+            engine.dispose()
+            engine = SessionLocal = None
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_SQLITE_PATH + suffix):
+                os.remove(DB_SQLITE_PATH + suffix)
+
+    with open(sql_file_path, 'r', encoding='utf-8') as f:
+        sql_script = f.read()
+    commands = [cmd.strip() for cmd in sql_script.split(';') if cmd.strip()]
+
+    db_engine = create_database_engine()
+    try:
+        with db_engine.begin() as connection:
+            for command in commands:
+                statement = _sqlite_statement(command)
+                if statement:
+                    connection.execute(text(statement))
+        print("Setup database dan proses seeding dari file SQL berhasil.")
+    except Exception as e:
+        print(f"Error saat menjalankan perintah SQL: {e}")
+        raise
+    finally:
+        db_engine.dispose()
+
 def setup_database_from_sql(sql_file_path: str, drop_db_if_exists: bool = True):
     if not os.path.exists(sql_file_path):
         print(f"Error: File seeding SQL tidak ditemukan di '{sql_file_path}'")
         return
+    if DB_BACKEND == "sqlite":
+        setup_sqlite_database_from_sql(sql_file_path, drop_db_if_exists)
+        return
     
     print("Memulai proses setup database dari file SQL...")    
     server_engine = create_engine(SERVER_ENGINE_URL, echo=False)
@@ -1,6 +1,14 @@
+import argparse
+import time
+
+from sqlalchemy import bindparam, select, update
+
 from src.core.encryption import encrypt
 from src.db.models import ApplicantProfile, ApplicationDetail
-from src.db.database import get_db_session
+from src.db.database import get_db_session, get_engine
+
+# Kolom ApplicantProfile yang dienkripsi
+ENCRYPTED_FIELDS = ("first_name", "last_name", "date_of_birth", "address", "phone_number")
 
 # Fungsi untuk mengenkripsi data yang ada di tabel ApplicantProfile dan ApplicationDetail
 def encrypt_all_data():
@@ -32,6 +40,73 @@ def encrypt_all_data():
 
         print("Semua data telah berhasil dienkripsi dan diperbarui.")
 
+# Fungsi untuk mengenkripsi ApplicantProfile secara bulk (tanpa ORM unit of work)
+def encrypt_all_data_bulk(batch_size: int = 1000) -> int:
+    """
+    Versi bulk dari encrypt_all_data untuk jumlah pelamar yang besar.
+
+    Baris dibaca per batch dengan keyset pagination (applicant_id > id terakhir, urut
+    primary key), dienkripsi dengan tabel enkripsi, lalu ditulis kembali dengan satu
+    UPDATE executemany per batch. Tidak ada cursor yang dibiarkan terbuka selama
+    penulisan, sehingga cara ini juga aman untuk SQLite.
+
+    Seperti encrypt_all_data, seluruh proses berjalan dalam satu transaksi: tabel tidak
+    menandai baris mana yang sudah terenkripsi, jadi proses yang terhenti di tengah harus
+    di-rollback seluruhnya. Commit per batch akan membuat pengulangan proses
+    mengenkripsi dua kali baris yang sudah di-commit.
+
+    Returns:
+        int: Jumlah baris yang dienkripsi.
+    """
+    table = ApplicantProfile.__table__
+    engine = get_engine()
+
+    # Nama parameter diberi awalan karena nama kolom di SET tidak boleh dipakai sebagai bindparam
+    update_statement = update(table).where(
+        table.c.applicant_id == bindparam("b_applicant_id")
+    ).values({field: bindparam(f"b_{field}") for field in ENCRYPTED_FIELDS})
+    select_statement = select(
+        table.c.applicant_id, *(table.c[field] for field in ENCRYPTED_FIELDS)
+    ).where(
+        table.c.applicant_id > bindparam("last_applicant_id")
+    ).order_by(table.c.applicant_id).limit(batch_size)
+
+    processed = 0
+    last_applicant_id = 0
+    start_time = time.perf_counter()
+    with engine.begin() as connection:
+        while True:
+            rows = connection.execute(select_statement, {"last_applicant_id": last_applicant_id}).all()
+            if not rows:
+                break
+
+            params = []
+            for applicant_id, *values in rows:
+                row_params = {"b_applicant_id": applicant_id}
+                for field, value in zip(ENCRYPTED_FIELDS, values):
+                    # Nilai NULL dibiarkan NULL
+                    row_params[f"b_{field}"] = encrypt(str(value)) if value is not None else None
+                params.append(row_params)
+
+            connection.execute(update_statement, params)
+
+            last_applicant_id = rows[-1][0]
+            processed += len(params)
+            elapsed = time.perf_counter() - start_time
+            print(f"{processed} baris dienkripsi ({processed / elapsed:.0f} baris/detik), belum di-commit...")
+
+    elapsed = time.perf_counter() - start_time
+    throughput = processed / elapsed if elapsed > 0 else 0.0
+    print(f"Semua data telah berhasil dienkripsi: {processed} baris dalam {elapsed:.2f} detik ({throughput:.0f} baris/detik).")
+    return processed
+
 if __name__ == "__main__":
-    encrypt_all_data()
-    print("Proses enkripsi data selesai.")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Enkripsi data sensitif di tabel ApplicantProfile.")
+    parser.add_argument("--orm", action="store_true", help="Gunakan cara lama (ORM, unit of work).")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Jumlah baris per batch pada mode bulk.")
+    args = parser.parse_args()
+    if args.orm:
+        encrypt_all_data()
+    else:
+        encrypt_all_data_bulk(batch_size=args.batch_size)
+    print("Proses enkripsi data selesai.")
@@ -0,0 +1,143 @@
+import argparse
+import json
+import os
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+
+from src.core.cv_cache import PARSER_VERSION, file_content_hash, get_cv_cache
+from src.db.database import get_db_session, PROJECT_ROOT
+from src.db.models import ApplicationDetail, CVExtraction
+
+
+def _is_unchanged(extraction, cv_path: str, full_cv_path: str, stat: os.stat_result) -> bool:
+    """Mengecek apakah hasil ingestion sebelumnya (baris metadata CVExtraction) masih sesuai dengan file CV saat ini."""
+    if extraction.cv_path != cv_path or extraction.parser_version != PARSER_VERSION:
+        return False
+    if extraction.file_size != stat.st_size:
+        return False
+    if extraction.file_mtime_ns == stat.st_mtime_ns:
+        return True
+    # mtime berubah tapi ukuran sama: pastikan lewat hash isi file
+    return extraction.content_hash == file_content_hash(full_cv_path)
+
+
+def _extraction_values(detail_id: int, applicant_id: int, cv_path: str,
+                       full_cv_path: str, stat: os.stat_result, extracted_cv_data: dict) -> dict:
+    return {
+        "detail_id": detail_id,
+        "applicant_id": applicant_id,
+        "cv_path": cv_path,
+        "file_mtime_ns": stat.st_mtime_ns,
+        "file_size": stat.st_size,
+        "content_hash": file_content_hash(full_cv_path),
+        "parser_version": PARSER_VERSION,
+        "full_text_raw": extracted_cv_data["full_text_raw"],
+        "full_text_normalized": extracted_cv_data["full_text_normalized"],
+        "full_text_search": extracted_cv_data["full_text_search"],
+        "phone_numbers": json.dumps(extracted_cv_data.get("phone_numbers", [])),
+        "skills": json.dumps(extracted_cv_data.get("skills", [])),
+        "job_history": json.dumps(extracted_cv_data.get("job_history", [])),
+        "education": json.dumps(extracted_cv_data.get("education", [])),
+        "ingested_at": datetime.now(),
+    }
+
+
+def ingest_all_cvs(force: bool = False, batch_size: int = 50, workers: int = None):
+    """
+    Mengekstrak seluruh CV di ApplicationDetail ke tabel CVExtraction.
+
+    Proses bersifat resumable: hasil di-commit setiap batch_size CV, dan CV yang
+    tidak berubah sejak ingestion sebelumnya dilewati. Gunakan force=True untuk
+    memproses ulang semuanya, termasuk mem-parsing ulang PDF yang ada di cache ekstraksi. PDF yang belum ada di cache di-parsing paralel
+    dengan `workers` proses.
+    """
+    processed = 0
+    skipped = 0
+    missing = 0
+
+    with get_db_session() as db:
+        details = db.query(
+            ApplicationDetail.detail_id,
+            ApplicationDetail.applicant_id,
+            ApplicationDetail.cv_path
+        ).order_by(ApplicationDetail.detail_id).all()
+        # Hanya kolom metadata; teks CV (LONGTEXT) tidak perlu dibaca untuk pengecekan
+        existing = {
+            row.detail_id: row for row in db.execute(select(
+                CVExtraction.detail_id,
+                CVExtraction.cv_path,
+                CVExtraction.file_mtime_ns,
+                CVExtraction.file_size,
+                CVExtraction.content_hash,
+                CVExtraction.parser_version
+            ))
+        }
+
+        print(f"Memulai ingestion {len(details)} CV ({len(existing)} sudah pernah diproses)...")
+
+        # Tahap 1: cari CV yang baru atau berubah
+        pending = {}
+        touched = []
+        for detail_id, applicant_id, cv_path in details:
+            full_cv_path = os.path.join(PROJECT_ROOT, cv_path)
+            if not os.path.exists(full_cv_path):
+                print(f"File CV tidak ditemukan di '{full_cv_path}'.")
+                missing += 1
+                continue
+
+            stat = os.stat(full_cv_path)
+            extraction = existing.get(detail_id)
+            if not force and extraction is not None and _is_unchanged(extraction, cv_path, full_cv_path, stat):
+                if extraction.file_mtime_ns != stat.st_mtime_ns:
+                    # Isi sama (hash cocok), cukup perbarui mtime
+                    touched.append({"detail_id": detail_id, "file_mtime_ns": stat.st_mtime_ns})
+                skipped += 1
+                continue
+            pending.setdefault(full_cv_path, []).append((detail_id, applicant_id, cv_path, stat))
+
+        if touched:
+            db.execute(update(CVExtraction), touched)
+
+        # Tahap 2: ekstraksi (paralel untuk PDF yang belum ter-cache), ditulis dan di-commit per batch
+        updates = []
+        for full_cv_path, extracted_cv_data in get_cv_cache().iter_load_many(list(pending), workers, force=force):
+            for detail_id, applicant_id, cv_path, stat in pending[full_cv_path]:
+                values = _extraction_values(detail_id, applicant_id, cv_path, full_cv_path, stat, extracted_cv_data)
+                if detail_id in existing:
+                    updates.append(values)
+                else:
+                    db.add(CVExtraction(**values))
+
+                processed += 1
+                if processed % batch_size == 0:
+                    if updates:
+                        db.execute(update(CVExtraction), updates)
+                        updates = []
+                    db.commit()
+                    print(f"{processed} CV diproses, {skipped} dilewati...")
+        if updates:
+            db.execute(update(CVExtraction), updates)
+
+        # Hapus hasil ingestion milik ApplicationDetail yang sudah tidak ada
+        valid_detail_ids = {detail_id for detail_id, _, _ in details}
+        stale_detail_ids = [detail_id for detail_id in existing if detail_id not in valid_detail_ids]
+        if stale_detail_ids:
+            db.execute(delete(CVExtraction).where(CVExtraction.detail_id.in_(stale_detail_ids)))
+        removed = len(stale_detail_ids)
+
+        db.commit()
+
+    print(
+        f"Ingestion selesai: {processed} CV diproses, {skipped} tidak berubah, "
+        f"{missing} file tidak ditemukan, {removed} entri usang dihapus."
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ekstraksi teks CV ke database (tabel CVExtraction).")
+    parser.add_argument("--force", action="store_true", help="Proses ulang semua CV walaupun tidak berubah (cache ekstraksi juga diabaikan).")
+    parser.add_argument("--batch-size", type=int, default=50, help="Jumlah CV per commit.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Jumlah proses parsing PDF (default: CV_PARSE_WORKERS atau jumlah core).")
+    args = parser.parse_args()
+    ingest_all_cvs(force=args.force, batch_size=args.batch_size, workers=args.workers)
@@ -1,8 +1,12 @@
 # src/db/models.py
-from sqlalchemy import create_engine, Column, Integer, String, Date, Text, DateTime
+from sqlalchemy import create_engine, Column, Integer, BigInteger, String, Date, Text, DateTime
+from sqlalchemy.dialects.mysql import LONGTEXT
 from sqlalchemy.orm import declarative_base, sessionmaker, Mapped, mapped_column
 from datetime import datetime
 
+# TEXT di MySQL hanya 64KB, teks CV lengkap bisa lebih panjang dari itu
+LongText = Text().with_variant(LONGTEXT(), "mysql")
+
 Base = declarative_base()
 
 class ApplicantProfile(Base):
@@ -19,4 +23,23 @@ class ApplicationDetail(Base):
     detail_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     applicant_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False)
     application_role: Mapped[str | None] = mapped_column(String(100))
-    cv_path: Mapped[str] = mapped_column(Text, nullable=False) 
\ No newline at end of file
+    cv_path: Mapped[str] = mapped_column(Text, nullable=False)
+
+class CVExtraction(Base):
+    """Hasil ekstraksi CV yang sudah dihitung sebelumnya oleh src.db.ingest (satu baris per ApplicationDetail)."""
+    __tablename__ = 'CVExtraction'
+    detail_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    applicant_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
+    cv_path: Mapped[str] = mapped_column(Text, nullable=False)
+    file_mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    file_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(40), nullable=False)
+    parser_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    full_text_raw: Mapped[str] = mapped_column(LongText, nullable=False)
+    full_text_normalized: Mapped[str] = mapped_column(LongText, nullable=False)
+    full_text_search: Mapped[str] = mapped_column(LongText, nullable=False)
+    phone_numbers: Mapped[str] = mapped_column(Text, nullable=False)
+    skills: Mapped[str] = mapped_column(LongText, nullable=False)
+    job_history: Mapped[str] = mapped_column(LongText, nullable=False)
+    education: Mapped[str] = mapped_column(LongText, nullable=False)
+    ingested_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
@@ -1,15 +1,26 @@
 import sys
+import threading
 from PySide6.QtWidgets import QApplication
 from .ui.main_window import MainWindow
 
 
+def _preload_search_modules():
+    """Import the search stack (SQLAlchemy, pdfplumber) in the background once the window is up."""
+    try:
+        from .core import search  # noqa: F401
+    except Exception:
+        # The search worker imports it again and reports the error to the user
+        pass
+
+
 def main():
     """Entry point of the application."""
     app = QApplication(sys.argv)
     window = MainWindow()
     window.showMaximized()
+    threading.Thread(target=_preload_search_modules, daemon=True).start()
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
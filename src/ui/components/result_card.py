@@ -9,18 +9,50 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QDesktopServices
 
 class ResultCard(QFrame):
-    """Card widget showing basic information about a CV match."""
+    """
+    Card widget showing basic information about a CV match.
 
-    # MODIFIED: Change signal to emit only int (applicant_id)
-    summary_clicked = Signal(int, str, str) # Emits the applicant_id for summary
+    Cards are meant to be recycled: the search page keeps one card per slot on a
+    results page and calls set_data() when the page changes, instead of creating
+    new widgets.
+    """
+
+    summary_clicked = Signal(object) # Emits the CVDataHandle of this application; the summary page fetches the rest on demand
     view_cv_clicked = Signal(str) # Emits the cv_path string for viewing CV
 
-    def __init__(self, data: dict):
+    def __init__(self, data: dict = None):
         super().__init__()
-        self._data = data
+        self._data = {}
+        # Keyword labels are reused across set_data() calls; extra ones are hidden
+        self._keyword_labels = []
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setObjectName("resultCard")
         self._build_ui()
+        self.set_data(data or {})
+
+    def set_data(self, data: dict):
+        """Shows another result in this card, reusing the existing child widgets."""
+        self._data = data
+        self.name_lbl.setText(data.get("name", "<Unknown>"))
+        self.total_matches_lbl.setText(f"{data.get('total_matches', 0)} matches")
+
+        matched_keywords_detail = data.get("matched_keywords_detail", {})
+
+        # Sort keywords for consistent numbering, though not strictly required by request
+        sorted_keywords = sorted(matched_keywords_detail.items(), key=lambda item: item[0])
+
+        while len(self._keyword_labels) < len(sorted_keywords):
+            keyword_lbl = QLabel()
+            self.keywords_list_layout.addWidget(keyword_lbl)
+            self._keyword_labels.append(keyword_lbl)
+
+        for i, keyword_lbl in enumerate(self._keyword_labels):
+            if i < len(sorted_keywords):
+                keyword, occurrence = sorted_keywords[i]
+                keyword_lbl.setText(f"{i+1}. {keyword}: {occurrence} occurence{'s' if occurrence > 1 else ''}")
+                keyword_lbl.show()
+            else:
+                keyword_lbl.hide()
 
     def _build_ui(self):
         # Main vertical layout for the card
@@ -30,43 +62,29 @@ class ResultCard(QFrame):
 
         # Top section: Name (left) and Total Matches (right)
         top_h_layout = QHBoxLayout()
-        name_lbl = QLabel(self._data.get("name", "<Unknown>"))
-        name_lbl.setObjectName("h3")
-        top_h_layout.addWidget(name_lbl)
+        self.name_lbl = QLabel()
+        self.name_lbl.setObjectName("h3")
+        top_h_layout.addWidget(self.name_lbl)
         top_h_layout.addStretch(1) # Pushes match_count_lbl to the right
 
-        total_matches_lbl = QLabel(f"{self._data.get('total_matches', 0)} matches")
-        top_h_layout.addWidget(total_matches_lbl)
+        self.total_matches_lbl = QLabel()
+        top_h_layout.addWidget(self.total_matches_lbl)
         main_v_layout.addLayout(top_h_layout)
 
         # Matched keywords section
         matched_keywords_title_lbl = QLabel("Matched keywords:")
         main_v_layout.addWidget(matched_keywords_title_lbl)
 
-        # Keyword list with numbering and occurrences
-        keywords_list_layout = QVBoxLayout()
-        matched_keywords_detail = self._data.get("matched_keywords_detail", {})
-
-        # Sort keywords for consistent numbering, though not strictly required by request
-        sorted_keywords = sorted(matched_keywords_detail.items(), key=lambda item: item[0])
-
-        for i, (keyword, occurrence) in enumerate(sorted_keywords):
-            keyword_lbl = QLabel(f"{i+1}. {keyword}: {occurrence} occurence{'s' if occurrence > 1 else ''}")
-            keywords_list_layout.addWidget(keyword_lbl)
-
-        main_v_layout.addLayout(keywords_list_layout)
+        # Keyword list with numbering and occurrences (filled in by set_data)
+        self.keywords_list_layout = QVBoxLayout()
+        main_v_layout.addLayout(self.keywords_list_layout)
 
         main_v_layout.addStretch(1) # Pushes buttons to the bottom
 
         # Bottom section: Buttons (Summary left, View CV right)
         bottom_h_layout = QHBoxLayout()
         summary_btn = QPushButton("Summary")
-        # MODIFIED: Emit only applicant_id
-        summary_btn.clicked.connect(lambda: self.summary_clicked.emit(
-            self._data.get("applicant_id"),
-            self._data.get("cv_path", ""),
-            self._data.get("cv_content", "")
-        ))
+        summary_btn.clicked.connect(lambda: self.summary_clicked.emit(self._data["cv_data"]))
         bottom_h_layout.addWidget(summary_btn)
 
         bottom_h_layout.addStretch(1) # Pushes View CV button to the right
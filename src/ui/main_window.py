@@ -28,9 +28,9 @@ class MainWindow(QMainWindow):
         self.search_page.summary_requested.connect(self._show_summary_page)
         self.summary_page.back_requested.connect(self._show_search_page)
 
-    def _show_summary_page(self, applicant_id: int, cv_path: str, cv_content: str):
-        """Navigate to the summary page and load data for the selected candidate."""
-        self.summary_page.load_candidate(applicant_id, cv_path, cv_content)
+    def _show_summary_page(self, cv_data):
+        """Navigate to the summary page and load data for the selected application."""
+        self.summary_page.load_candidate(cv_data)
         self._stack.setCurrentWidget(self.summary_page)
 
     def _show_search_page(self):
@@ -1,7 +1,7 @@
 from functools import partial
 from PySide6.QtWidgets import QApplication, QProgressBar, QMessageBox # Import QMessageBox
 from PySide6.QtGui import QPalette
-from PySide6.QtCore import Signal, Qt, QPropertyAnimation, QRect, QEasingCurve, QThread, QObject # Import QThread, QObject
+from PySide6.QtCore import Signal, Qt, QPropertyAnimation, QRect, QEasingCurve, QThread, QObject, QTimer # Import QThread, QObject
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,30 +16,54 @@ from PySide6.QtWidgets import (
     QSizePolicy
 )
 
-from src.core.search import perform_search
 from .components.keyword_input import KeywordInput
 from .components.result_card import ResultCard
 
-class SearchWorker(QObject):
-    finished = Signal(list, int, dict)
-    error = Signal(str)
+# Minimum interval between two grid refreshes while partial results are streaming in
+PARTIAL_RESULTS_REFRESH_MS = 300
 
-    def __init__(self, keywords_tuple, selected_algorithm, top_n):
+class SearchWorker(QObject):
+    # Every signal carries the search id first, so results still queued from a
+    # superseded search can be told apart from the current one
+    finished = Signal(int, list, int, dict)
+    progress = Signal(int, int, int, str) # search id, processed CVs, total CVs, stage ("indexing" / "matching")
+    partial_results = Signal(int, list, int, dict) # search id, running top-N, processed CVs, timings so far
+    cancelled = Signal(int)
+    error = Signal(int, str)
+
+    def __init__(self, search_id, keywords_tuple, selected_algorithm, top_n):
         super().__init__()
+        from src.core.cancellation import CancellationToken
+
+        self.search_id = search_id
         self.keywords_tuple = keywords_tuple
         self.selected_algorithm = selected_algorithm
         self.top_n = top_n
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """Called from the GUI thread; the search stops at its next cancellation check."""
+        self.cancel_token.cancel()
 
     def run(self):
+        from src.core.cancellation import SearchCancelled
+
         try:
-            results, total_cv_scan, timings = perform_search(
-                self.keywords_tuple,
-                self.selected_algorithm,
-                self.top_n
-            )
-            self.finished.emit(results, total_cv_scan, timings)
+            # Diimpor di thread worker agar SQLAlchemy/pdfplumber tidak menahan munculnya jendela
+            from src.core.search import iter_search
+
+            for event in iter_search(self.keywords_tuple, self.selected_algorithm, self.top_n,
+                                     cancel_token=self.cancel_token):
+                if event["done"]:
+                    self.finished.emit(self.search_id, event["results"], event["total_cv_scan"], event["timings"])
+                    break
+                self.progress.emit(self.search_id, event["processed"], event["total_cv_scan"], event["stage"])
+                if event["results"] is not None:
+                    self.partial_results.emit(self.search_id, event["results"], event["processed"], event["timings"])
+        except SearchCancelled:
+            self.cancelled.emit(self.search_id)
         except Exception as e:
-            self.error.emit(f"An error occurred during search: {str(e)}")
+            self.error.emit(self.search_id, f"An error occurred during search: {str(e)}")
 
 class AlgorithmToggle(QWidget):
     """
@@ -161,7 +185,7 @@ class AlgorithmToggle(QWidget):
 class SearchPage(QWidget):
     """Page that lets the recruiter search CVs by keyword."""
 
-    summary_requested = Signal(int, str, str)
+    summary_requested = Signal(object)
     view_cv_requested = Signal(str, str)
 
     def __init__(self) -> None:
@@ -172,6 +196,8 @@ class SearchPage(QWidget):
         self.setProperty("theme", theme_name)
         self.current_page = 0
         self.results_per_page = 10
+        self.results_columns = 4
+        self.min_result_rows = 2
         self.all_results = []
         self._build_ui()
         self._show_initial_message()
@@ -179,6 +205,16 @@ class SearchPage(QWidget):
 
         self.search_thread = None
         self.search_worker = None
+        self._search_id = 0
+        # Search threads that may still be running (superseded searches wind down after cancel)
+        self._search_threads = []
+
+        # Partial results are applied at most once per PARTIAL_RESULTS_REFRESH_MS
+        self._pending_partial_results = None
+        self._partial_refresh_timer = QTimer(self)
+        self._partial_refresh_timer.setSingleShot(True)
+        self._partial_refresh_timer.setInterval(PARTIAL_RESULTS_REFRESH_MS)
+        self._partial_refresh_timer.timeout.connect(self._apply_pending_partial_results)
 
     # UI construction
     def _build_ui(self):
@@ -206,7 +242,7 @@ class SearchPage(QWidget):
         algorithm_label.setStyleSheet("font-weight: bold; font-size: 10pt;")
         algorithm_selection_layout.addWidget(algorithm_label)
 
-        self.algo_toggle = AlgorithmToggle(algorithms=["KMP", "Boyer-Moore", "Aho-Corasick"])
+        self.algo_toggle = AlgorithmToggle(algorithms=["KMP", "Boyer-Moore", "Horspool", "Sunday", "Aho-Corasick"])
         self.algo_toggle.algorithm_selected.connect(self._on_algorithm_selected)
         self.algo_toggle.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         algorithm_selection_layout.addWidget(self.algo_toggle)
@@ -260,6 +296,7 @@ class SearchPage(QWidget):
         self.results_grid_layout = QGridLayout(self.results_container)
         self.results_grid_layout.setSpacing(10)
         self.results_scroll_area.setWidget(self.results_container)
+        self._build_result_slots()
         
         self.results_frame_layout.addWidget(self.results_scroll_area)
 
@@ -342,30 +379,61 @@ class SearchPage(QWidget):
         )
         self.selected_algorithm = None
 
+    def _build_result_slots(self):
+        """
+        Creates the grid widgets once: one ResultCard per slot on a results page, the
+        placeholders that keep short pages laid out, and a message label. Paging only
+        refills and shows/hides these widgets, so nothing is recreated.
+        """
+        self.grid_message_label = QLabel()
+        self.grid_message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.grid_message_label.setStyleSheet("color: #888; font-style: italic; font-size: 16px;")
+        self.grid_message_label.setWordWrap(True)
+        self.grid_message_label.hide()
+        self.results_grid_layout.addWidget(
+            self.grid_message_label, 0, 0, self.min_result_rows, self.results_columns, Qt.AlignmentFlag.AlignCenter
+        )
+
+        self.result_cards = []
+        self.result_placeholders = []
+        for i in range(max(self.results_per_page, self.min_result_rows * self.results_columns)):
+            row, col = divmod(i, self.results_columns)
+            if i < self.results_per_page:
+                card = ResultCard()
+                card.summary_clicked.connect(self.summary_requested.emit)
+                card.hide()
+                self.results_grid_layout.addWidget(card, row, col)
+                self.result_cards.append(card)
+            if i < self.min_result_rows * self.results_columns:
+                placeholder_widget = QWidget()
+                placeholder_widget.setMinimumSize(150, 100)
+                placeholder_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+                placeholder_widget.hide()
+                self.results_grid_layout.addWidget(placeholder_widget, row, col)
+                self.result_placeholders.append(placeholder_widget)
+
+    def _show_grid_message(self, text: str):
+        self._reset_grid()
+        self.grid_message_label.setText(text)
+        self.grid_message_label.show()
+        for i in range(self.results_columns):
+            self.results_grid_layout.setColumnStretch(i, 1)
+        for i in range(self.min_result_rows):
+            self.results_grid_layout.setRowStretch(i, 1)
+
     def _show_initial_message(self):
         """Displays a message in the results area when no search has been performed."""
         self.loading_widget.hide()
         self.results_scroll_area.show()
-        self._clear_grid_layout()
-
-        message_label = QLabel("Please input keywords, top matches, and select an algorithm to perform a search.")
-        message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message_label.setStyleSheet("color: #888; font-style: italic; font-size: 16px;")
-        message_label.setWordWrap(True)
-
-        self.results_grid_layout.addWidget(message_label, 0, 0, 1, 1, Qt.AlignmentFlag.AlignCenter)
-        self.results_grid_layout.setRowStretch(0, 1)
-        self.results_grid_layout.setColumnStretch(0, 1)
-
-    def _clear_grid_layout(self):
-        """Helper method to completely clear the grid layout"""
-        while self.results_grid_layout.count():
-            item = self.results_grid_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-            elif item.spacerItem():
-                self.results_grid_layout.removeItem(item)
+        self._show_grid_message("Please input keywords, top matches, and select an algorithm to perform a search.")
+
+    def _reset_grid(self):
+        """Hides every pooled grid widget (they are reused, never deleted) and resets the stretches."""
+        self.grid_message_label.hide()
+        for card in self.result_cards:
+            card.hide()
+        for placeholder_widget in self.result_placeholders:
+            placeholder_widget.hide()
 
         for i in range(self.results_grid_layout.rowCount()):
             self.results_grid_layout.setRowStretch(i, 0)
@@ -380,6 +448,13 @@ class SearchPage(QWidget):
     def _on_search_clicked(self):
         keywords = self.keyword_input.keywords()
         if not keywords:
+            # A running search must not paint its results over the cleared page
+            self._cancel_current_search()
+            self._pending_partial_results = None
+            self._partial_refresh_timer.stop()
+            self.all_results = []
+            self.current_page = 0
+            self._update_pagination_buttons()
             self.exec_time_lbl.setText("Please enter at least one keyword!")
             self.total_cv_lbl.setText("")
             self._show_initial_message()
@@ -390,31 +465,91 @@ class SearchPage(QWidget):
             self.total_cv_lbl.setText("")
             return
 
-        self._set_ui_enabled(False)
+        # The previous search (if any) is cancelled instead of being left to finish in the background
+        self._cancel_current_search()
 
-        self._clear_grid_layout()
+        self._reset_grid()
         self.results_scroll_area.hide()
+        self.loading_text_label.setText("Loading . . .")
         self.loading_widget.show()
+        self.all_results = []
+        self.current_page = 0
+        self._pending_partial_results = None
+        self._partial_refresh_timer.stop()
 
         top_n = self.top_spin.value()
         keywords_tuple = tuple(keywords)
 
+        self._search_id += 1
+        self._search_threads = [thread for thread in self._search_threads if not thread.isFinished()]
         self.search_thread = QThread()
-        self.search_worker = SearchWorker(keywords_tuple, self.selected_algorithm, top_n)
+        self.search_worker = SearchWorker(self._search_id, keywords_tuple, self.selected_algorithm, top_n)
+        self._search_threads.append(self.search_thread)
         
         self.search_worker.moveToThread(self.search_thread)
 
         self.search_thread.started.connect(self.search_worker.run)
         self.search_worker.finished.connect(self._on_search_finished)
+        self.search_worker.progress.connect(self._on_search_progress)
+        self.search_worker.partial_results.connect(self._on_partial_results)
         self.search_worker.error.connect(self._on_search_error)
         
-        self.search_worker.finished.connect(self.search_thread.quit)
-        self.search_worker.finished.connect(self.search_worker.deleteLater)
-        self.search_thread.finished.connect(self.search_thread.deleteLater)
+        for done_signal in (self.search_worker.finished, self.search_worker.error, self.search_worker.cancelled):
+            done_signal.connect(self.search_thread.quit)
+            done_signal.connect(self.search_worker.deleteLater)
         
         self.search_thread.start()
 
-    def _on_search_finished(self, results, total_cv_scan, timings):
+    def _cancel_current_search(self):
+        """Cancels the running search; its thread stops at the next cancellation check."""
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+            self.search_worker = None
+
+    def _is_current_search(self, search_id: int) -> bool:
+        """False for signals that were already queued by a search that has since been cancelled."""
+        return self.search_worker is not None and search_id == self.search_worker.search_id
+
+    def _on_search_progress(self, search_id, processed, total_cv_scan, stage):
+        if not self._is_current_search(search_id):
+            return
+        if stage == "indexing":
+            # New or changed CVs are being read/parsed before keyword matching starts
+            self.loading_text_label.setText(f"Indexing CVs . . . ({processed}/{total_cv_scan})")
+            self.total_cv_lbl.setText(f"CVs Indexed: {processed} of {total_cv_scan}")
+            return
+        self.loading_text_label.setText(f"Loading . . . ({processed}/{total_cv_scan} CVs)")
+        self.total_cv_lbl.setText(f"CVs Processed: {processed} of {total_cv_scan}")
+
+    def _on_partial_results(self, search_id, results, processed, timings):
+        """Shows the running top-N while the scan continues (throttled)."""
+        if not self._is_current_search(search_id):
+            return
+        self._pending_partial_results = results
+        if not self._partial_refresh_timer.isActive():
+            # Leading edge: show the first batch right away, then wait out the interval
+            self._apply_pending_partial_results()
+
+    def _apply_pending_partial_results(self):
+        if self._pending_partial_results is None:
+            return
+        self.all_results = self._pending_partial_results
+        self._pending_partial_results = None
+        total_pages = (len(self.all_results) + self.results_per_page - 1) // self.results_per_page
+        self.current_page = min(self.current_page, max(0, total_pages - 1))
+
+        self.loading_widget.hide()
+        self.results_scroll_area.show()
+        self._populate_current_page_results()
+        self._update_pagination_buttons()
+        self._partial_refresh_timer.start()
+
+    def _on_search_finished(self, search_id, results, total_cv_scan, timings):
+        if not self._is_current_search(search_id):
+            return
+        self.search_worker = None
+        self._partial_refresh_timer.stop()
+        self._pending_partial_results = None
         self.all_results = results
         self.current_page = 0
 
@@ -431,7 +566,13 @@ class SearchPage(QWidget):
 
         self._set_ui_enabled(True)
 
-    def _on_search_error(self, message):
+    def _on_search_error(self, search_id, message):
+        if not self._is_current_search(search_id):
+            return
+        self.search_worker = None
+        self._partial_refresh_timer.stop()
+        self._pending_partial_results = None
+        self.all_results = []
         QMessageBox.critical(self, "Search Error", message)
         
         self.loading_widget.hide()
@@ -453,61 +594,32 @@ class SearchPage(QWidget):
 
 
     def _populate_current_page_results(self):
-        self._clear_grid_layout()
+        self._reset_grid()
 
         start_index = self.current_page * self.results_per_page
         end_index = start_index + self.results_per_page
         current_page_results = self.all_results[start_index:end_index]
 
-        num_cols = 4
-        min_rows_to_display = 2
+        num_cols = self.results_columns
+        min_rows_to_display = self.min_result_rows
 
-        if not current_page_results and max(len(self.all_results), min_rows_to_display * num_cols) == 0:
-            no_results_label = QLabel("No results found for the given keywords. Try different keywords.")
-            no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_results_label.setStyleSheet("color: #888; font-style: italic; font-size: 16px;")
-            no_results_label.setWordWrap(True)
-
-            self.results_grid_layout.addWidget(no_results_label, 0, 0, 1, num_cols, Qt.AlignmentFlag.AlignCenter)
-            self.results_grid_layout.setRowStretch(0, 1)
-            self.results_grid_layout.setColumnStretch(0, 1)
-            return
-        elif not current_page_results:
-            no_results_label = QLabel("No results found for the given keywords. Try different keywords.")
-            no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_results_label.setStyleSheet("color: #888; font-style: italic; font-size: 16px;")
-            no_results_label.setWordWrap(True)
-            self.results_grid_layout.addWidget(no_results_label, 0, 0, min_rows_to_display, num_cols, Qt.AlignmentFlag.AlignCenter)
-
-            for i in range(num_cols):
-                self.results_grid_layout.setColumnStretch(i, 1)
-            for i in range(min_rows_to_display):
-                self.results_grid_layout.setRowStretch(i, 1)
+        if not current_page_results:
+            self._show_grid_message("No results found for the given keywords. Try different keywords.")
             return
 
-        row, col = 0, 0
-        for i in range(max(len(current_page_results), min_rows_to_display * num_cols)):
+        slot_count = max(len(current_page_results), min_rows_to_display * num_cols)
+        for i in range(slot_count):
             if i < len(current_page_results):
-                res = current_page_results[i]
-                card = ResultCard(res)
-                card.summary_clicked.connect(self.summary_requested.emit)
-                card.view_cv_clicked.connect(partial(self.view_cv_requested.emit, res.get("name", "N/A"), res.get("cv_content", "CV content not available.")))
-                self.results_grid_layout.addWidget(card, row, col)
+                card = self.result_cards[i]
+                card.set_data(current_page_results[i])
+                card.show()
             else:
-                placeholder_widget = QWidget()
-                placeholder_widget.setMinimumSize(150, 100)
-                placeholder_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-                self.results_grid_layout.addWidget(placeholder_widget, row, col)
-
-            col += 1
-            if col >= num_cols:
-                col = 0
-                row += 1
+                self.result_placeholders[i].show()
 
         for i in range(num_cols):
             self.results_grid_layout.setColumnStretch(i, 1)
         
-        for i in range(max(row, min_rows_to_display)):
+        for i in range(max(slot_count // num_cols, min_rows_to_display)):
             self.results_grid_layout.setRowStretch(i, 1)
 
     def _update_pagination_buttons(self):
@@ -9,7 +9,6 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QSizePolicy
 )
-from src.core.summary import get_candidate_summary
 
 class SummaryPage(QWidget):
     """Displays extracted summary information for a single candidate CV."""
@@ -19,7 +18,7 @@ class SummaryPage(QWidget):
     def __init__(self):
         super().__init__()
         self._build_ui()
-        self.current_applicant_id = None
+        self.current_detail_id = None
 
     def _build_ui(self):
         root = QVBoxLayout(self)
@@ -298,12 +297,17 @@ class SummaryPage(QWidget):
                     self._clear_layout(item.layout())
 
     # Public API
-    def load_candidate(self, applicant_id: int, cv_path: str, cv_content: str):
+    def load_candidate(self, cv_data):
+        """
+        Shows the application behind a search result's CVDataHandle. The profile and the
+        extracted CV fields are fetched on demand (cached in src.core.catalog).
+        """
+        self.current_detail_id = cv_data.detail_id
 
-        self.current_applicant_id = applicant_id
+        from src.core.summary import get_candidate_summary
 
-        candidate_data = get_candidate_summary(applicant_id, cv_path, cv_content)
-        print(f"Loading candidate data for ID {applicant_id}: {candidate_data}")
+        candidate_data = get_candidate_summary(cv_data.detail_id)
+        print(f"Loading candidate data for application {cv_data.detail_id}: {candidate_data}")
         if not candidate_data:
             self.name_lbl.setText("Candidate Not Found")
             self.birthdate_lbl.setText("Birthdate: -")